@@ -0,0 +1,40 @@
+"""
+In-process TTL Cache for WAHA FastAPI Application
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class AsyncTTLCache:
+    """Cache awaitable results in-process, each entry expiring after ``ttl`` seconds"""
+
+    def __init__(self, ttl: float, timeout: Optional[float] = None):
+        self.ttl = ttl
+        self.timeout = timeout
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+
+    async def get_or_set(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for key, awaiting factory() on a miss (bounded by ``timeout``)"""
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        # Per-key lock: concurrent misses on one key share a single factory call without blocking other keys
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another caller may have filled the entry while we waited
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+
+            value = await asyncio.wait_for(factory(), self.timeout)
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            return value
+
+    def clear(self):
+        """Drop all cached entries"""
+        self._entries.clear()
+        self._locks.clear()
@@ -2,12 +2,30 @@
 Configuration Settings for WAHA FastAPI Application
 """
 
+import base64
 import os
 import secrets
+import time
 from datetime import datetime
+from functools import cached_property, lru_cache
 from typing import List, Optional
-from pydantic import field_validator
-from pydantic_settings import BaseSettings as PydanticBaseSettings
+from pydantic import Field, PrivateAttr, field_validator, model_validator
+from pydantic_settings import BaseSettings as PydanticBaseSettings, SettingsConfigDict
+
+
+# Second-resolution ISO prefix cache: (epoch_second, "YYYY-MM-DDTHH:MM:SS")
+_iso_prefix_cache = (-1, "")
+
+
+def _iso_utcnow() -> str:
+    """Get current UTC time in ISO format, reusing the per-second prefix"""
+    global _iso_prefix_cache
+    sec, usec = divmod(int(time.time() * 1_000_000), 1_000_000)
+    cached_sec, prefix = _iso_prefix_cache
+    if sec != cached_sec:
+        prefix = datetime.utcfromtimestamp(sec).strftime("%Y-%m-%dT%H:%M:%S")
+        _iso_prefix_cache = (sec, prefix)
+    return f"{prefix}.{usec:06d}Z"
 
 
 class Settings(PydanticBaseSettings):
@@ -26,8 +44,8 @@ class Settings(PydanticBaseSettings):
     ENVIRONMENT: str = "development"
 
     # Security
-    SECRET_KEY: str = secrets.token_urlsafe(32)
-    JWT_SECRET: str = secrets.token_urlsafe(32)
+    SECRET_KEY: str = Field(default_factory=lambda: secrets.token_urlsafe(32))
+    JWT_SECRET: str = Field(default_factory=lambda: secrets.token_urlsafe(32))
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRE_MINUTES: int = 60 * 24  # 24 hours
 
@@ -46,15 +64,20 @@ class Settings(PydanticBaseSettings):
     # Auto-Response Configuration
     AUTO_RESPONSE_ENABLED: bool = True
     RESPONSE_DELAY_MS: int = 1000
+    AUTO_RESPONSE_WORKERS: int = 4
     DEFAULT_SESSION: str = "default"
 
     # Webhook Configuration
     WEBHOOK_SECRET: str = "webhook-secret-key"
     WEBHOOK_VERIFY_TOKEN: str = "webhook-verify-token"
+    # Answer processed webhooks with an empty 200 instead of the JSON summary
+    WEBHOOK_MINIMAL_RESPONSE: bool = False
 
     # Cache Configuration
     CACHE_ENABLED: bool = True
     CACHE_TTL_SECONDS: int = 300
+    STATISTICS_CACHE_TTL_SECONDS: int = 60
+    HEALTH_CACHE_TTL_SECONDS: int = 5
 
     # Logging Configuration
     LOG_LEVEL: str = "INFO"
@@ -68,11 +91,15 @@ class Settings(PydanticBaseSettings):
     DEFAULT_LIMIT: int = 100
     MAX_LIMIT: int = 1000
     DEFAULT_OFFSET: int = 0
+    OFFSET_WARN_THRESHOLD: int = 1000
 
     # Timeout Configuration
     REQUEST_TIMEOUT: int = 30
     WAHA_TIMEOUT: int = 30
 
+    # Concurrent WAHA sends per /send/batch request
+    BATCH_SEND_CONCURRENCY: int = 64
+
     @field_validator("DEBUG", mode="before")
     @classmethod
     def set_debug_mode(cls, v):
@@ -95,46 +122,64 @@ class Settings(PydanticBaseSettings):
             raise ValueError("WAHA_API_URL is required")
         return v.rstrip("/")
 
-    @field_validator("ALLOWED_ORIGINS", mode="before")
-    @classmethod
-    def parse_allowed_origins(cls, v):
-        """Parse allowed origins from comma-separated string"""
-        if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",") if origin.strip()]
-        return v
-
-    @field_validator("ALLOWED_HOSTS", mode="before")
+    @field_validator("ALLOWED_ORIGINS", "ALLOWED_HOSTS", mode="before")
     @classmethod
-    def parse_allowed_hosts(cls, v):
-        """Parse allowed hosts from comma-separated string"""
+    def _split_csv(cls, v):
+        """Parse allowed origins/hosts from comma-separated string"""
         if isinstance(v, str):
-            return [host.strip() for host in v.split(",") if host.strip()]
+            return [item.strip() for item in v.split(",") if item.strip()]
         return v
 
-    model_config = {
-        "env_file": ".env",
-        "env_file_encoding": "utf-8",
-        "case_sensitive": True
-    }
+    # Environment flags derived once after validation
+    _is_development: bool = PrivateAttr(default=False)
+    _is_production: bool = PrivateAttr(default=False)
+
+    @model_validator(mode="after")
+    def cache_environment_flags(self):
+        """Cache environment checks so they are plain attribute reads"""
+        environment = self.ENVIRONMENT.lower()
+        self._is_development = environment == "development"
+        self._is_production = environment == "production"
+        return self
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        frozen=True,
+        validate_assignment=False
+    )
 
     def get_current_time(self) -> str:
         """Get current time in ISO format"""
-        return datetime.utcnow().isoformat() + "Z"
+        return _iso_utcnow()
+
+    @cached_property
+    def basic_auth_header(self) -> str:
+        """Get the WAHA Basic Authorization header value"""
+        auth_string = f"{self.WAHA_USERNAME}:{self.WAHA_PASSWORD}"
+        return "Basic " + base64.b64encode(auth_string.encode("ascii")).decode("ascii")
 
     def is_development(self) -> bool:
         """Check if running in development mode"""
-        return self.ENVIRONMENT.lower() == "development"
+        return self._is_development
 
     def is_production(self) -> bool:
         """Check if running in production mode"""
-        return self.ENVIRONMENT.lower() == "production"
+        return self._is_production
 
     def get_cors_origins(self) -> List[str]:
         """Get CORS origins based on environment"""
-        if self.is_development():
+        if self._is_development:
             return ["*"]
         return self.ALLOWED_ORIGINS
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the cached application settings instance"""
+    return Settings()
+
+
 # Create settings instance
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
@@ -2,131 +2,139 @@
 Custom Exceptions for WAHA FastAPI Application
 """
 
+import traceback
+
 from fastapi import HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from api.core.config import settings
 
 
+# Static error details shared by the routes, built once; handlers only read them
+SCAN_QR_DETAIL = {
+    "success": False,
+    "error": "WhatsApp session needs QR code scan",
+    "code": "SCAN_QR_REQUIRED",
+    "details": {
+        "message": "Please scan QR code in WAHA dashboard",
+        "waha_url": f"{settings.WAHA_API_URL}/"
+    }
+}
+SESSION_DISCONNECTED_DETAIL = {
+    "success": False,
+    "error": "WhatsApp session is disconnected",
+    "code": "SESSION_DISCONNECTED",
+    "details": {
+        "message": "Please reconnect WhatsApp session"
+    }
+}
+
+
 class WAHAException(Exception):
     """Base WAHA exception"""
 
+    CODE: str = None
+    STATUS: int = 500
+
     def __init__(
         self,
         message: str,
         code: str = None,
-        status_code: int = 500,
+        status_code: int = None,
         details: dict = None
     ):
         self.message = message
-        self.code = code
-        self.status_code = status_code
+        self.code = code or self.CODE
+        self.status_code = status_code or self.STATUS
         self.details = details or {}
         super().__init__(self.message)
 
 
-class WAHAConnectionException(WAHAException):
-    """WAHA connection exception"""
+class _WAHACodedException(WAHAException):
+    """WAHA exception with a fixed code and status code"""
 
     def __init__(self, message: str, details: dict = None):
-        super().__init__(
-            message=message,
-            code="WAHA_CONNECTION_ERROR",
-            status_code=503,
-            details=details
-        )
+        super().__init__(message=message, details=details)
 
 
-class WAHAAuthenticationException(WAHAException):
-    """WAHA authentication exception"""
+class WAHAConnectionException(_WAHACodedException):
+    """WAHA connection exception"""
+    CODE = "WAHA_CONNECTION_ERROR"
+    STATUS = 503
 
-    def __init__(self, message: str, details: dict = None):
-        super().__init__(
-            message=message,
-            code="AUTHENTICATION_ERROR",
-            status_code=401,
-            details=details
-        )
+
+class WAHAAuthenticationException(_WAHACodedException):
+    """WAHA authentication exception"""
+    CODE = "AUTHENTICATION_ERROR"
+    STATUS = 401
 
 
-class WAHAValidationException(WAHAException):
+class WAHAValidationException(_WAHACodedException):
     """WAHA validation exception"""
-
-    def __init__(self, message: str, details: dict = None):
-        super().__init__(
-            message=message,
-            code="VALIDATION_ERROR",
-            status_code=400,
-            details=details
-        )
+    CODE = "VALIDATION_ERROR"
+    STATUS = 400
 
 
 class WAHARateLimitException(WAHAException):
     """WAHA rate limit exception"""
+    CODE = "RATE_LIMIT_EXCEEDED"
+    STATUS = 429
 
     def __init__(self, message: str, retry_after: int = None, details: dict = None):
-        super().__init__(
-            message=message,
-            code="RATE_LIMIT_EXCEEDED",
-            status_code=429,
-            details=details
-        )
+        super().__init__(message=message, details=details)
         self.retry_after = retry_after
 
 
 class WAHASessionException(WAHAException):
     """WAHA session exception"""
+    CODE = "SESSION_ERROR"
+    STATUS = 422
 
     def __init__(self, message: str, session_status: str = None, details: dict = None):
-        super().__init__(
-            message=message,
-            code="SESSION_ERROR",
-            status_code=422,
-            details=details
-        )
+        super().__init__(message=message, details=details)
         self.session_status = session_status
 
 
-async def waha_exception_handler(request: Request, exc: WAHAException) -> JSONResponse:
+def _error_metadata(request: Request) -> dict:
+    """Build the metadata block shared by all error responses"""
+    return {
+        "timestamp": settings.get_current_time(),
+        "path": request.url.path,
+        "method": request.method,
+        "request_id": getattr(request.state, "request_id", None)
+    }
+
+
+async def waha_exception_handler(request: Request, exc: WAHAException) -> ORJSONResponse:
     """Global WAHA exception handler"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
             "error": exc.message,
             "code": exc.code,
             "details": exc.details if settings.DEBUG else None,
-            "metadata": {
-                "timestamp": settings.get_current_time(),
-                "path": str(request.url.path),
-                "method": request.method,
-                "request_id": getattr(request.state, "request_id", None)
-            }
+            "metadata": _error_metadata(request)
         }
     )
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
     """HTTP exception handler"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
             "error": exc.detail,
             "code": f"HTTP_{exc.status_code}",
-            "metadata": {
-                "timestamp": settings.get_current_time(),
-                "path": str(request.url.path),
-                "method": request.method,
-                "request_id": getattr(request.state, "request_id", None)
-            }
+            "metadata": _error_metadata(request)
         }
     )
 
 
-async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
     """Validation exception handler"""
     errors = []
     for error in exc.errors():
@@ -137,7 +145,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
             "input": error["input"] if settings.DEBUG else None
         })
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "success": False,
@@ -147,44 +155,39 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
                 "errors": errors,
                 "error_count": len(errors)
             },
-            "metadata": {
-                "timestamp": settings.get_current_time(),
-                "path": str(request.url.path),
-                "method": request.method,
-                "request_id": getattr(request.state, "request_id", None)
-            }
+            "metadata": _error_metadata(request)
         }
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """General exception handler"""
-    import traceback
+    details = {"error": str(exc), "traceback": None}
+    if settings.DEBUG:
+        details["traceback"] = "".join(traceback.TracebackException.from_exception(exc).format())
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "success": False,
             "error": "Internal server error",
             "code": "INTERNAL_ERROR",
-            "details": {
-                "error": str(exc),
-                "traceback": traceback.format_exc() if settings.DEBUG else None
-            },
-            "metadata": {
-                "timestamp": settings.get_current_time(),
-                "path": str(request.url.path),
-                "method": request.method,
-                "request_id": getattr(request.state, "request_id", None)
-            }
+            "details": details,
+            "metadata": _error_metadata(request)
         }
     )
 
 
+_EXCEPTION_HANDLERS = (
+    (WAHAException, waha_exception_handler),
+    (HTTPException, http_exception_handler),
+    (RequestValidationError, validation_exception_handler),
+    (StarletteHTTPException, http_exception_handler),
+    (Exception, general_exception_handler),
+)
+
+
 def setup_exception_handlers(app):
     """Setup exception handlers for FastAPI app"""
-    app.add_exception_handler(WAHAException, waha_exception_handler)
-    app.add_exception_handler(HTTPException, http_exception_handler)
-    app.add_exception_handler(RequestValidationError, validation_exception_handler)
-    app.add_exception_handler(StarletteHTTPException, http_exception_handler)
-    app.add_exception_handler(Exception, general_exception_handler)
\ No newline at end of file
+    for exc_class, handler in _EXCEPTION_HANDLERS:
+        app.add_exception_handler(exc_class, handler)
\ No newline at end of file
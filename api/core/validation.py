@@ -0,0 +1,16 @@
+"""
+Shared Validation Helpers for WAHA FastAPI Application
+"""
+
+import re
+from typing import Literal
+
+
+SortOrder = Literal["asc", "desc"]
+
+CHAT_ID_RE = re.compile(r"\d+@c\.us")
+
+
+def is_valid_chat_id(chat_id: str) -> bool:
+    """Check the 628123456789@c.us format, rejecting on the suffix before running the regex"""
+    return chat_id.endswith("@c.us") and CHAT_ID_RE.fullmatch(chat_id) is not None
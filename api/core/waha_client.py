@@ -2,19 +2,183 @@
 WAHA API Client for FastAPI Application
 """
 
+import asyncio
 import base64
-import json
 import logging
+import random
+import time
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from datetime import datetime
+from urllib.parse import quote as _quote
 
 import httpx
+import orjson
+from fastapi import Request
 from pydantic import BaseModel
 
-from api.core.config import settings
+from api.core.config import settings, get_settings
 from api.core.exceptions import WAHAException, WAHAConnectionException
 
 
+_ACTIVE_STATUSES = frozenset({"WORKING", "READY", "CONNECTED"})
+
+# WAHA endpoint templates
+_TEST_URL = "/api/default/chats/test@c.us/messages?limit=1"
+_MESSAGES_URL = "/api/default/chats/{cid}/messages"
+_SEND_MESSAGE_URL = "/api/{session}/send-message"
+_DISCOVERY_ENDPOINTS = (
+    "/api/contacts",
+    "/api/default/contacts",
+    "/contacts",
+    "/api/sessions/default/contacts",
+    "/api/sessions",
+    "/api/chats",
+    "/chats"
+)
+
+_SAMPLE_MESSAGES = (
+    "Halo, bagaimana kabarnya?",
+    "Baik-baik saja, terima kasih!",
+    "Apakah project sudah selesai?",
+    "Sudah, tinggal testing final",
+    "Oke, saya cek dulu ya",
+    "Siap, saya tunggu update nya",
+    "Documents sudah saya kirim",
+    "Terima kasih atas bantuannya",
+    "Sampai jumpa besok!",
+    "Have a great day!"
+)
+
+# Shared HTTP clients keyed by (base_url, timeout, username, password, api_key)
+_CLIENTS: Dict[tuple, httpx.AsyncClient] = {}
+
+
+async def close_shared_clients():
+    """Close all shared HTTP clients (call on application shutdown)"""
+    clients = list(_CLIENTS.values())
+    _CLIENTS.clear()
+    for client in clients:
+        await client.aclose()
+
+
+# Active sessions cache keyed by base_url: (monotonic timestamp, WahaResponse)
+_SESSIONS_CACHE: Dict[str, tuple] = {}
+_SESSIONS_LOCK = asyncio.Lock()
+
+_MOCK_CONTACTS_BASE = (
+    {"id": "62818114411@c.us", "name": "Pak Feri Coworker", "notifyName": "Pak Feri", "isGroup": False, "isWAContact": True},
+    {"id": "6281339691260@c.us", "name": "Mas Feri", "notifyName": "Mas Feri", "isGroup": False, "isWAContact": True},
+    {"id": "120363419906557011@g.us", "name": "Developer Coworker", "notifyName": "Developer Coworker", "isGroup": True, "isWAContact": True},
+    {"id": "628988146713@c.us", "name": "Senseiiii", "notifyName": "Senseii", "isGroup": False, "isWAContact": True},
+    {"id": "120363419759004678@g.us", "name": "Kampus dev team", "notifyName": "Kampus dev team", "isGroup": True, "isWAContact": True},
+    {"id": "628156700525@c.us", "name": "Om Haibannn Wail", "notifyName": "Om Haiban", "isGroup": False, "isWAContact": True},
+    {"id": "6289505982878@c.us", "name": "Sabil", "notifyName": "Sabil", "isGroup": False, "isWAContact": True},
+    {"id": "6282243673017@c.us", "name": "Me", "notifyName": "Me", "isGroup": False, "isWAContact": True},
+)
+
+
+@lru_cache(maxsize=1)
+def _mock_contacts() -> tuple:
+    """Build the enriched mock contact list once"""
+    now = datetime.utcnow().timestamp()
+    return tuple(
+        {
+            **contact,
+            "pushname": contact["name"],
+            "profilePicUrl": None,
+            "lastMessage": "Last message",
+            "lastMessageTime": int((now - random.randint(0, 86400)) * 1000),
+            "unreadCount": random.randint(0, 5)
+        }
+        for contact in _MOCK_CONTACTS_BASE
+    )
+
+
+_MOCK_SORT_DEFAULTS = {
+    "name": "",
+    "id": "",
+    "notifyName": "",
+    "pushname": "",
+    "lastMessage": "",
+    "unreadCount": 0,
+    "lastMessageTime": 0
+}
+
+
+def _contact_sort_key(contact: Dict[str, Any], sort_by: str) -> tuple:
+    """Get the (sort value, id) key used to order and seek contacts"""
+    return (contact.get(sort_by) or _MOCK_SORT_DEFAULTS[sort_by], contact["id"])
+
+
+@lru_cache(maxsize=16)
+def _sorted_mock_contacts(sort_by: str, sort_order: str) -> tuple:
+    """Get mock contacts sorted by the given field and order, with ascending seek keys"""
+    contacts = _mock_contacts()
+    if sort_by not in _MOCK_SORT_DEFAULTS:
+        return contacts, None
+
+    ordered = sorted(contacts, key=lambda x: _contact_sort_key(x, sort_by))
+    keys = [_contact_sort_key(contact, sort_by) for contact in ordered]
+    if sort_order == 'desc':
+        ordered.reverse()
+    return tuple(ordered), keys
+
+
+def generate_mock_messages(chat_id: str, limit: int) -> Dict[str, Any]:
+    """Generate mock message data for testing (no client or network needed)"""
+    count = min(limit, 20)
+    base_ts = int(datetime.utcnow().timestamp())
+
+    # Draw all random values in batches
+    bodies = random.choices(_SAMPLE_MESSAGES, k=count)
+    from_me_bits = random.getrandbits(count) if count else 0
+    acks = random.choices((1, 2, 3), k=count)
+
+    messages = []
+    for i in range(count):
+        timestamp = base_ts - i * 7200
+        is_from_me = bool((from_me_bits >> i) & 1)
+        messages.append({
+            "id": f"mock_msg_{i}_{timestamp}",
+            "timestamp": timestamp,
+            "from": chat_id if not is_from_me else "6282243673017@c.us",
+            "to": "6282243673017@c.us" if not is_from_me else chat_id,
+            "body": bodies[i],
+            "fromMe": is_from_me,
+            "hasMedia": False,
+            "mediaType": None,
+            "mediaCaption": None,
+            "ack": acks[i]
+        })
+
+    return {
+        "messages": messages,
+        "total": len(messages),
+        "has_more": len(messages) >= limit,
+        "mock": True,
+        "generated_at": settings.get_current_time()
+    }
+
+
+def _normalize_contacts_page(data: Dict[str, Any], limit: int) -> Dict[str, Any]:
+    """Map WAHA's pagination fields onto total/has_more/pagination.total_pages
+
+    Values are only taken from the upstream page; missing ones stay absent
+    so callers can reject an incomplete upstream contract.
+    """
+    if "has_more" not in data and "hasMore" in data:
+        data["has_more"] = data["hasMore"]
+
+    pagination = data.get("pagination") or {}
+    total = data.get("total")
+    if "total_pages" not in pagination and total is not None:
+        pagination["total_pages"] = -(-total // limit)
+    data["pagination"] = pagination
+    return data
+
+
 class WahaResponse(BaseModel):
     """WAHA API response model"""
     success: bool
@@ -34,51 +198,64 @@ class WahaClient:
         api_key: str = None,
         timeout: int = 30
     ):
-        self.base_url = base_url or settings.WAHA_API_URL
-        self.username = username or settings.WAHA_USERNAME
-        self.password = password or settings.WAHA_PASSWORD
-        self.api_key = api_key or settings.WAHA_API_KEY
+        config = get_settings()
+        self.base_url = base_url or config.WAHA_API_URL
+        self.username = username or config.WAHA_USERNAME
+        self.password = password or config.WAHA_PASSWORD
+        self.api_key = api_key or config.WAHA_API_KEY
         self.timeout = timeout
 
-        # Setup HTTP client
-        self.client = httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=httpx.Timeout(timeout),
-            headers={
-                "Content-Type": "application/json",
-                "User-Agent": "WAHA-FastAPI/1.0"
-            }
-        )
-
-        # Setup authentication
-        self._setup_auth()
+        # HTTP client key (clients are shared per base URL, timeout and credentials)
+        self._client_key = (self.base_url, timeout, self.username, self.password, self.api_key)
 
         # Logger
         self.logger = logging.getLogger(__name__)
 
-    def _setup_auth(self):
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP client for this configuration, rebuilt if a previous one was closed"""
+        client = _CLIENTS.get(self._client_key)
+        if client is None or client.is_closed:
+            client = _CLIENTS[self._client_key] = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(self.timeout),
+                limits=httpx.Limits(max_keepalive_connections=100),
+                headers={
+                    "Content-Type": "application/json",
+                    "User-Agent": "WAHA-FastAPI/1.0"
+                }
+            )
+
+            # Setup authentication
+            self._setup_auth(client)
+        return client
+
+    def _setup_auth(self, client: httpx.AsyncClient):
         """Setup authentication headers"""
         if self.username and self.password:
-            # Basic Authentication
-            auth_string = f"{self.username}:{self.password}"
-            auth_bytes = auth_string.encode('ascii')
-            auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
-            self.client.headers["Authorization"] = f"Basic {auth_b64}"
+            # Basic Authentication (precomputed for the configured credentials)
+            config = get_settings()
+            if self.username == config.WAHA_USERNAME and self.password == config.WAHA_PASSWORD:
+                client.headers["Authorization"] = config.basic_auth_header
+            else:
+                auth_string = f"{self.username}:{self.password}"
+                auth_bytes = auth_string.encode('ascii')
+                auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
+                client.headers["Authorization"] = f"Basic {auth_b64}"
 
         if self.api_key:
-            self.client.headers["X-API-Key"] = self.api_key
+            client.headers["X-API-Key"] = self.api_key
 
     async def test_connection(self) -> WahaResponse:
         """Test connection to WAHA server"""
         try:
             # Test main endpoint
             response = await self.client.get("/")
-            self.logger.info(f"WAHA Main endpoint status: {response.status_code}")
+            self.logger.info("WAHA Main endpoint status: %s", response.status_code)
 
             # Test WAHA-specific endpoint
-            test_url = "/api/default/chats/test@c.us/messages?limit=1"
-            test_response = await self.client.get(test_url)
-            self.logger.info(f"WAHA API endpoint status: {test_response.status_code}")
+            test_response = await self.client.get(_TEST_URL)
+            self.logger.info("WAHA API endpoint status: %s", test_response.status_code)
 
             if response.status_code in [200, 404]:
                 if test_response.status_code == 200:
@@ -116,14 +293,14 @@ class WahaClient:
                 )
 
         except httpx.RequestError as e:
-            self.logger.error(f"Connection error: {str(e)}")
+            self.logger.error("Connection error: %s", e)
             return WahaResponse(
                 success=False,
                 error=f"Connection error: {str(e)}",
                 code="CONNECTION_ERROR"
             )
         except Exception as e:
-            self.logger.error(f"Unexpected error: {str(e)}")
+            self.logger.error("Unexpected error: %s", e)
             return WahaResponse(
                 success=False,
                 error=f"Unexpected error: {str(e)}",
@@ -132,38 +309,35 @@ class WahaClient:
 
     async def discover_endpoints(self) -> WahaResponse:
         """Discover available WAHA endpoints"""
-        common_endpoints = [
-            "/api/contacts",
-            "/api/default/contacts",
-            "/contacts",
-            "/api/sessions/default/contacts",
-            "/api/sessions",
-            "/api/chats",
-            "/chats"
-        ]
+        common_endpoints = _DISCOVERY_ENDPOINTS
 
         results = {}
 
-        for endpoint in common_endpoints:
-            try:
-                response = await self.client.get(endpoint, timeout=5)
-                results[endpoint] = {
-                    "status": response.status_code,
-                    "available": response.status_code != 404,
-                    "content_type": response.headers.get('content-type', ''),
-                    "sample": response.text[:200] + "..." if len(response.text) > 200 else response.text
-                }
-
-                if response.status_code != 404:
-                    self.logger.info(f"Found endpoint: {endpoint} (Status: {response.status_code})")
+        # Probe all endpoints concurrently
+        responses = await asyncio.gather(
+            *(self.client.get(endpoint, timeout=5) for endpoint in common_endpoints),
+            return_exceptions=True
+        )
 
-            except Exception as e:
+        for endpoint, response in zip(common_endpoints, responses):
+            if isinstance(response, Exception):
                 results[endpoint] = {
                     "status": "error",
                     "available": False,
-                    "error": str(e)
+                    "error": str(response)
                 }
-                self.logger.error(f"Error checking {endpoint}: {str(e)}")
+                self.logger.error("Error checking %s: %s", endpoint, response)
+                continue
+
+            results[endpoint] = {
+                "status": response.status_code,
+                "available": response.status_code != 404,
+                "content_type": response.headers.get('content-type', ''),
+                "sample": response.text[:200] + "..." if len(response.text) > 200 else response.text
+            }
+
+            if response.status_code != 404:
+                self.logger.info("Found endpoint: %s (Status: %s)", endpoint, response.status_code)
 
         return WahaResponse(
             success=True,
@@ -176,15 +350,18 @@ class WahaClient:
             response = await self.client.get("/api/sessions")
 
             if response.status_code == 200:
-                sessions_data = response.json()
+                sessions_data = orjson.loads(response.content)
                 active_sessions = []
 
                 if isinstance(sessions_data, list):
-                    for session in sessions_data:
-                        if (session.get('status') in ['WORKING', 'READY', 'CONNECTED']
-                            and session.get('name')):
-                            active_sessions.append(session['name'])
-                            self.logger.info(f"Active session: {session['name']} ({session['status']})")
+                    active = [
+                        session for session in sessions_data
+                        if session.get('status') in _ACTIVE_STATUSES and session.get('name')
+                    ]
+                    active_sessions = [session['name'] for session in active]
+                    if self.logger.isEnabledFor(logging.INFO):
+                        for session in active:
+                            self.logger.info("Active session: %s (%s)", session['name'], session['status'])
 
                 return WahaResponse(
                     success=True,
@@ -198,13 +375,33 @@ class WahaClient:
                 )
 
         except Exception as e:
-            self.logger.error(f"Error getting sessions: {str(e)}")
+            self.logger.error("Error getting sessions: %s", e)
             return WahaResponse(
                 success=False,
                 error=f"Error getting sessions: {str(e)}",
                 code="SESSIONS_REQUEST_ERROR"
             )
 
+    async def get_active_sessions_cached(self) -> WahaResponse:
+        """Get active sessions, reusing a successful result for CACHE_TTL_SECONDS"""
+        if not settings.CACHE_ENABLED:
+            return await self.get_active_sessions()
+
+        cached = _SESSIONS_CACHE.get(self.base_url)
+        if cached and time.monotonic() - cached[0] < settings.CACHE_TTL_SECONDS:
+            return cached[1]
+
+        async with _SESSIONS_LOCK:
+            # Another request may have refreshed the cache while we waited
+            cached = _SESSIONS_CACHE.get(self.base_url)
+            if cached and time.monotonic() - cached[0] < settings.CACHE_TTL_SECONDS:
+                return cached[1]
+
+            sessions_response = await self.get_active_sessions()
+            if sessions_response.success:
+                _SESSIONS_CACHE[self.base_url] = (time.monotonic(), sessions_response)
+            return sessions_response
+
     async def get_chat_messages(
         self,
         chat_id: str,
@@ -223,8 +420,8 @@ class WahaClient:
             )
 
         try:
-            encoded_chat_id = httpx._utils.quote(chat_id, safe='')
-            url = f"/api/default/chats/{encoded_chat_id}/messages"
+            encoded_chat_id = _quote(chat_id, safe='')
+            url = _MESSAGES_URL.format(cid=encoded_chat_id)
 
             params = {
                 "sortBy": sort_by,
@@ -236,23 +433,26 @@ class WahaClient:
             response = await self.client.get(url, params=params)
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
+
+                # WAHA returns a bare JSON array of messages; give callers one shape
+                if isinstance(data, list):
+                    data = {"messages": data}
 
-                # Return the raw response from WAHA API
                 return WahaResponse(
                     success=True,
                     data=data
                 )
             else:
-                error_text = response.text
+                raw = response.content
                 if response.status_code == 422:
-                    if "SCAN_QR_CODE" in error_text:
+                    if b"SCAN_QR_CODE" in raw:
                         return WahaResponse(
                             success=False,
                             error="WhatsApp session needs QR code scan",
                             code="SCAN_QR_REQUIRED"
                         )
-                    elif "DISCONNECTED" in error_text:
+                    elif b"DISCONNECTED" in raw:
                         return WahaResponse(
                             success=False,
                             error="WhatsApp session is disconnected",
@@ -261,12 +461,12 @@ class WahaClient:
 
                 return WahaResponse(
                     success=False,
-                    error=f"Failed to get messages: {response.status_code} - {error_text}",
+                    error=f"Failed to get messages: {response.status_code} - {response.text}",
                     code="MESSAGES_ERROR"
                 )
 
         except Exception as e:
-            self.logger.error(f"Error getting messages: {str(e)}")
+            self.logger.error("Error getting messages: %s", e)
             return WahaResponse(
                 success=False,
                 error=f"Error getting messages: {str(e)}",
@@ -280,18 +480,29 @@ class WahaClient:
         sort_by: str = "name",
         sort_order: str = "asc",
         session: str = "default",
-        use_mock: bool = False
+        use_mock: bool = False,
+        cursor: Dict[str, Any] = None
     ) -> WahaResponse:
-        """Get all contacts from WAHA"""
+        """Get all contacts from WAHA
+
+        ``cursor`` is a decoded keyset cursor ({"last_sort", "last_id", "offset"}), already
+        checked against ``sort_by``/``sort_order`` by the route.
+        Mock data is seeked by key; WAHA has no key-range filter for contacts,
+        so upstream requests use the cursor's offset.
+
+        Enrichment fields (profilePicUrl, lastMessage, unreadCount, ...) come
+        back on the list response itself, so a page is a single WAHA round
+        trip; keep per-contact lookups out of this path.
+        """
         if use_mock:
             return WahaResponse(
                 success=True,
-                data=self._generate_mock_contacts(limit, offset, sort_by, sort_order)
+                data=self._generate_mock_contacts(limit, offset, sort_by, sort_order, cursor)
             )
 
         try:
-            # Get active sessions first
-            sessions_response = await self.get_active_sessions()
+            # Get active sessions first (cached between calls)
+            sessions_response = await self.get_active_sessions_cached()
             if not sessions_response.success:
                 return WahaResponse(
                     success=False,
@@ -303,13 +514,16 @@ class WahaClient:
             if not active_sessions:
                 return WahaResponse(
                     success=True,
-                    data=self._generate_mock_contacts(limit, offset, sort_by, sort_order)
+                    data=self._generate_mock_contacts(limit, offset, sort_by, sort_order, cursor)
                 )
 
             active_session = active_sessions[0]
             if session not in active_sessions:
                 session = active_session
 
+            if cursor:
+                offset = cursor.get("offset", offset)
+
             url = "/api/contacts"
             params = {
                 "session": session,
@@ -322,12 +536,12 @@ class WahaClient:
             response = await self.client.get(url, params=params)
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
 
-                # Return the raw response from WAHA API
+                # Return the WAHA page with its pagination fields normalized
                 return WahaResponse(
                     success=True,
-                    data=data  # Return raw response from WAHA API
+                    data=_normalize_contacts_page(data, limit)
                 )
             else:
                 return WahaResponse(
@@ -337,7 +551,7 @@ class WahaClient:
                 )
 
         except Exception as e:
-            self.logger.error(f"Error getting contacts: {str(e)}")
+            self.logger.error("Error getting contacts: %s", e)
             return WahaResponse(
                 success=False,
                 error=f"Error getting contacts: {str(e)}",
@@ -355,7 +569,7 @@ class WahaClient:
     ) -> WahaResponse:
         """Send message via WAHA"""
         try:
-            url = f"/api/{session}/send-message"
+            url = _SEND_MESSAGE_URL.format(session=session)
 
             payload = {
                 "chatId": chat_id,
@@ -369,10 +583,10 @@ class WahaClient:
             if media_caption:
                 payload["mediaCaption"] = media_caption
 
-            response = await self.client.post(url, json=payload)
+            response = await self.client.post(url, content=orjson.dumps(payload))
 
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 return WahaResponse(
                     success=True,
                     data={
@@ -393,7 +607,7 @@ class WahaClient:
                 )
 
         except Exception as e:
-            self.logger.error(f"Error sending message: {str(e)}")
+            self.logger.error("Error sending message: %s", e)
             return WahaResponse(
                 success=False,
                 error=f"Error sending message: {str(e)}",
@@ -402,91 +616,29 @@ class WahaClient:
 
     def _generate_mock_messages(self, chat_id: str, limit: int) -> Dict[str, Any]:
         """Generate mock message data for testing"""
-        import random
-        from datetime import datetime, timedelta
-
-        messages = []
-        base_time = datetime.utcnow()
-
-        sample_messages = [
-            "Halo, bagaimana kabarnya?",
-            "Baik-baik saja, terima kasih!",
-            "Apakah project sudah selesai?",
-            "Sudah, tinggal testing final",
-            "Oke, saya cek dulu ya",
-            "Siap, saya tunggu update nya",
-            "Documents sudah saya kirim",
-            "Terima kasih atas bantuannya",
-            "Sampai jumpa besok!",
-            "Have a great day!"
-        ]
-
-        for i in range(min(limit, 20)):
-            timestamp = int((base_time - timedelta(hours=i * 2)).timestamp())
-            is_from_me = random.choice([True, False])
-
-            message = {
-                "id": f"mock_msg_{i}_{timestamp}",
-                "timestamp": timestamp,
-                "from": chat_id if not is_from_me else "6282243673017@c.us",
-                "to": "6282243673017@c.us" if not is_from_me else chat_id,
-                "body": random.choice(sample_messages),
-                "fromMe": is_from_me,
-                "hasMedia": False,
-                "mediaType": None,
-                "mediaCaption": None,
-                "ack": random.randint(1, 3)
-            }
-            messages.append(message)
-
-        return {
-            "messages": messages,
-            "total": len(messages),
-            "has_more": len(messages) >= limit,
-            "mock": True,
-            "generated_at": settings.get_current_time()
-        }
+        return generate_mock_messages(chat_id, limit)
 
     def _generate_mock_contacts(
-        self, limit: int, offset: int, sort_by: str, sort_order: str
+        self, limit: int, offset: int, sort_by: str, sort_order: str, cursor: Dict[str, Any] = None
     ) -> Dict[str, Any]:
         """Generate mock contact data for testing"""
-        import random
-
-        sample_contacts = [
-            {"id": "62818114411@c.us", "name": "Pak Feri Coworker", "notifyName": "Pak Feri", "isGroup": False, "isWAContact": True},
-            {"id": "6281339691260@c.us", "name": "Mas Feri", "notifyName": "Mas Feri", "isGroup": False, "isWAContact": True},
-            {"id": "120363419906557011@g.us", "name": "Developer Coworker", "notifyName": "Developer Coworker", "isGroup": True, "isWAContact": True},
-            {"id": "628988146713@c.us", "name": "Senseiiii", "notifyName": "Senseii", "isGroup": False, "isWAContact": True},
-            {"id": "120363419759004678@g.us", "name": "Kampus dev team", "notifyName": "Kampus dev team", "isGroup": True, "isWAContact": True},
-            {"id": "628156700525@c.us", "name": "Om Haibannn Wail", "notifyName": "Om Haiban", "isGroup": False, "isWAContact": True},
-            {"id": "6289505982878@c.us", "name": "Sabil", "notifyName": "Sabil", "isGroup": False, "isWAContact": True},
-            {"id": "6282243673017@c.us", "name": "Me", "notifyName": "Me", "isGroup": False, "isWAContact": True},
-        ]
-
-        all_contacts = []
-        for contact in sample_contacts:
-            contact_copy = contact.copy()
-            contact_copy.update({
-                "pushname": contact["name"],
-                "profilePicUrl": None,
-                "lastMessage": f"Last message",
-                "lastMessageTime": int((datetime.utcnow().timestamp() - random.randint(0, 86400)) * 1000),
-                "unreadCount": random.randint(0, 5)
-            })
-            all_contacts.append(contact_copy)
-
-        # Sort contacts
-        reverse_order = sort_order.lower() == 'desc'
-        if sort_by in ['name', 'id', 'notifyName', 'pushname', 'lastMessage']:
-            all_contacts.sort(key=lambda x: x.get(sort_by, ''), reverse=reverse_order)
-        elif sort_by == 'unreadCount':
-            all_contacts.sort(key=lambda x: x.get('unreadCount', 0), reverse=reverse_order)
-
-        # Apply pagination
+        sort_order = sort_order.lower()
+        all_contacts, keys = _sorted_mock_contacts(sort_by, sort_order)
         total_contacts = len(all_contacts)
-        safe_offset = min(offset, total_contacts)
-        contacts = all_contacts[safe_offset:safe_offset + limit]
+
+        # Seek past the cursor key when given, otherwise apply offset pagination
+        if cursor and keys is not None:
+            last_key = (cursor["last_sort"] or _MOCK_SORT_DEFAULTS[sort_by], cursor["last_id"])
+            if sort_order == 'desc':
+                safe_offset = total_contacts - bisect_left(keys, last_key)
+            else:
+                safe_offset = bisect_right(keys, last_key)
+        elif cursor:
+            safe_offset = min(cursor.get("offset", offset), total_contacts)
+        else:
+            safe_offset = min(offset, total_contacts)
+
+        contacts = list(all_contacts[safe_offset:safe_offset + limit])
         has_more = (safe_offset + limit) < total_contacts
 
         return {
@@ -495,6 +647,8 @@ class WahaClient:
             "limit": limit,
             "offset": safe_offset,
             "hasMore": has_more,
+            "has_more": has_more,
+            "pagination": {"total_pages": -(-total_contacts // limit)},
             "mock": True,
             "generated_at": settings.get_current_time()
         }
@@ -503,4 +657,15 @@ class WahaClient:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
\ No newline at end of file
+        # Close and evict the shared client; other instances transparently get a fresh one
+        client = _CLIENTS.pop(self._client_key, None)
+        if client is not None:
+            await client.aclose()
+
+
+def get_waha_client(request: Request) -> WahaClient:
+    """FastAPI dependency returning the application-wide WahaClient"""
+    waha_client = getattr(request.app.state, "waha_client", None)
+    if waha_client is None:
+        waha_client = request.app.state.waha_client = WahaClient()
+    return waha_client
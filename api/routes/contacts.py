@@ -2,83 +2,260 @@
 Contacts Routes
 """
 
+import base64
+import binascii
+import logging
 import time
+from bisect import bisect_left
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Literal, Optional
 
-from fastapi import APIRouter, Request, Depends, HTTPException, Query
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, validator
+import orjson
+from fastapi import APIRouter, Request, Response, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field
 
+from api.core.cache import AsyncTTLCache
 from api.core.config import settings
-from api.core.waha_client import WahaClient
-from api.core.exceptions import WAHAException, WAHASessionException
-
-router = APIRouter()
+from api.core.validation import SortOrder
+from api.core.waha_client import WahaClient, get_waha_client
+from api.core.exceptions import SCAN_QR_DETAIL, SESSION_DISCONNECTED_DETAIL, WAHAException, WAHASessionException
+
+router = APIRouter(default_response_class=ORJSONResponse)
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the unread-count buckets; anything above the last is its own bucket
+_UNREAD_BUCKETS = (0, 5, 10, 50)
+_UNREAD_KEYS = ("zero_unread", "1_to_5_unread", "6_to_10_unread", "11_to_50_unread", "more_than_50_unread")
+
+_NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Static error details, built once; handlers only read them
+_INVALID_CURSOR_DETAIL = {
+    "success": False,
+    "error": "Invalid pagination cursor",
+    "code": "INVALID_CURSOR"
+}
+_UPSTREAM_CONTRACT_DETAIL = {
+    "success": False,
+    "error": "WAHA contacts response is missing pagination fields",
+    "code": "UPSTREAM_CONTRACT_ERROR",
+    "details": {
+        "required": ["total", "has_more", "pagination.total_pages"]
+    }
+}
+_STATISTICS_UNAVAILABLE_DETAIL = {
+    "success": False,
+    "error": "Unable to retrieve contacts for statistics",
+    "code": "STATISTICS_ERROR"
+}
+
+_statistics_cache = AsyncTTLCache(ttl=settings.STATISTICS_CACHE_TTL_SECONDS, timeout=settings.WAHA_TIMEOUT)
+
+
+# Keys of an enriched contact, in output order; ?fields= projections select from these
+_CONTACT_FIELDS = (
+    "id",
+    "name",
+    "display_name",
+    "is_group",
+    "is_wa_contact",
+    "last_message",
+    "last_message_time",
+    "unread_count",
+    "profile_pic_url",
+    "phone",
+    "type",
+    "notify_name",
+    "pushname"
+)
+
+
+ContactSortField = Literal["name", "id", "notifyName", "pushname", "lastMessage", "unreadCount", "lastMessageTime"]
+
+# Contact sort fields holding integers; the rest sort as strings
+_NUMERIC_SORT_FIELDS = frozenset({"unreadCount", "lastMessageTime"})
 
 
 class ContactRequest(BaseModel):
     """Request model for getting contacts"""
-    limit: int = 100
-    offset: int = 0
-    sort_by: str = "name"
-    sort_order: str = "asc"
+    limit: int = Field(100, ge=1, le=settings.MAX_LIMIT)
+    offset: int = Field(0, ge=0)
+    sort_by: ContactSortField = "name"
+    sort_order: SortOrder = "asc"
     session: str = "default"
     use_mock: bool = False
+    cursor: Optional[str] = None
+    fields: Optional[str] = None
 
-    @validator('limit')
-    def validate_limit(cls, v):
-        if v <= 0 or v > settings.MAX_LIMIT:
-            raise ValueError(f'Limit must be between 1 and {settings.MAX_LIMIT}')
-        return v
-
-    @validator('offset')
-    def validate_offset(cls, v):
-        if v < 0:
-            raise ValueError('Offset must be non-negative')
-        return v
-
-    @validator('sort_by')
-    def validate_sort_by(cls, v):
-        allowed = ['name', 'id', 'notifyName', 'pushname', 'lastMessage', 'unreadCount', 'lastMessageTime']
-        if v not in allowed:
-            raise ValueError(f'Sort by must be one of: {", ".join(allowed)}')
-        return v
 
-    @validator('sort_order')
-    def validate_sort_order(cls, v):
-        if v not in ['asc', 'desc']:
-            raise ValueError('Sort order must be asc or desc')
-        return v
-
-
-@router.get("/contacts", summary="Get WhatsApp Contacts")
-async def get_contacts(
-    request: Request,
-    limit: int = Query(100, ge=1, le=settings.MAX_LIMIT, description="Number of contacts to retrieve"),
-    offset: int = Query(0, ge=0, description="Offset for pagination"),
-    sort_by: str = Query("name", regex="^(name|id|notifyName|pushname|lastMessage|unreadCount|lastMessageTime)$", description="Field to sort by"),
-    sort_order: str = Query("asc", regex="^(asc|desc)$", description="Sort order"),
-    session: str = Query("default", description="WAHA session name"),
-    use_mock: bool = Query(False, description="Use mock data for testing")
-) -> Dict[str, Any]:
-    """
-    Retrieve WhatsApp contacts from WAHA API
+def _encode_cursor(last_sort: Any, last_id: str, offset: int, sort_by: str, sort_order: str) -> str:
+    """Encode an opaque keyset pagination cursor, bound to the sort it was issued under"""
+    payload = {
+        "last_sort": last_sort,
+        "last_id": last_id,
+        "offset": offset,
+        "sort_by": sort_by,
+        "sort_order": sort_order
+    }
+    return base64.urlsafe_b64encode(orjson.dumps(payload)).decode("ascii")
 
-    - **limit**: Number of contacts to retrieve (max 1000)
-    - **offset**: Pagination offset
-    - **sort_by**: Field to sort contacts by
-    - **sort_order**: Sort direction (asc/desc)
-    - **session**: WAHA session name
-    - **use_mock**: Use mock data for testing
-    """
-    start_time = time.time()
 
+def _decode_cursor(cursor: str, sort_by: str, sort_order: str) -> Dict[str, Any]:
+    """Decode a keyset pagination cursor, raising 400 when malformed or issued under another sort"""
     try:
-        logger.info(f"Getting contacts - limit: {limit}, offset: {offset}, sort_by: {sort_by}")
+        payload = orjson.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        if not isinstance(payload, dict) or not isinstance(payload.get("last_id"), str):
+            raise ValueError("missing cursor fields")
+        if payload.get("sort_by") != sort_by or payload.get("sort_order") != sort_order:
+            raise ValueError("cursor issued under a different sort")
+        last_sort = payload.setdefault("last_sort", None)
+        sort_type = int if sort_by in _NUMERIC_SORT_FIELDS else str
+        if last_sort is not None and (type(last_sort) is not sort_type):
+            raise ValueError("cursor sort value does not match sort_by")
+        payload["offset"] = max(int(payload.get("offset", 0)), 0)
+        return payload
+    except (ValueError, TypeError, binascii.Error, orjson.JSONDecodeError):
+        raise HTTPException(status_code=400, detail=_INVALID_CURSOR_DETAIL)
+
+
+def _parse_fields(fields: str) -> List[str]:
+    """Resolve a comma-separated field list into contact keys, raising 400 on unknown fields"""
+    requested = frozenset(field.strip() for field in fields.split(",") if field.strip())
+    unknown = requested.difference(_CONTACT_FIELDS)
+    if unknown or not requested:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "success": False,
+                "error": "Invalid contact fields requested",
+                "code": "INVALID_FIELDS",
+                "details": {
+                    "unknown": sorted(unknown),
+                    "available": list(_CONTACT_FIELDS)
+                }
+            }
+        )
+    # Keep the canonical field order regardless of how the caller listed them
+    return [key for key in _CONTACT_FIELDS if key in requested]
+
+
+def _iter_processed_contacts(
+    contacts: List[Dict[str, Any]],
+    stats: Dict[str, int],
+    selected: Optional[List[str]] = None
+):
+    """Yield enriched contacts (optionally projected onto ``selected``), filling ``stats`` once the iteration completes"""
+    total = individuals = groups = wa_contacts = with_unread = total_unread = 0
+    for contact in contacts:
+        contact_id = contact.get("id")
+        is_group = bool(contact.get("isGroup"))
+        is_wa_contact = contact.get("isWAContact", False)
+        unread_count = contact.get("unreadCount", 0)
+        name, pushname, notify_name = contact.get("name"), contact.get("pushname"), contact.get("notifyName")
+        processed_contact = {
+            "id": contact_id,
+            "name": name or pushname or notify_name or "Unknown",
+            "display_name": pushname or notify_name or name or "Unknown",
+            "is_group": is_group,
+            "is_wa_contact": is_wa_contact,
+            "last_message": contact.get("lastMessage"),
+            "last_message_time": contact.get("lastMessageTime"),
+            "unread_count": unread_count,
+            "profile_pic_url": contact.get("profilePicUrl"),
+            "phone": (contact_id or "").partition("@")[0],
+            "type": "group" if is_group else "individual",
+            "notify_name": notify_name,
+            "pushname": pushname
+        }
+        if selected is not None:
+            processed_contact = {key: processed_contact[key] for key in selected}
+
+        total += 1
+        if is_group:
+            groups += 1
+        else:
+            individuals += 1
+        if is_wa_contact:
+            wa_contacts += 1
+        if unread_count > 0:
+            with_unread += 1
+        total_unread += unread_count
+
+        yield processed_contact
+
+    stats.update({
+        "total": total,
+        "individuals": individuals,
+        "groups": groups,
+        "wa_contacts": wa_contacts,
+        "with_unread": with_unread,
+        "total_unread": total_unread
+    })
+
+
+async def _stream_contacts_ndjson(
+    request_id: Optional[str],
+    contacts: List[Dict[str, Any]],
+    contacts_data: Dict[str, Any],
+    pagination: Dict[str, Any],
+    sorting: Dict[str, str],
+    session: str,
+    start_time: int,
+    now_iso: str,
+    selected: Optional[List[str]] = None
+):
+    """Stream contacts as NDJSON: a header line, one line per contact, then statistics"""
+    yield orjson.dumps({
+        "success": True,
+        "pagination": pagination,
+        "sorting": sorting,
+        "session": session,
+        "mock": contacts_data.get("mock", False),
+        "generated_at": contacts_data.get("generated_at", now_iso)
+    }) + b"\n"
+
+    stats = {}
+    for processed_contact in _iter_processed_contacts(contacts, stats, selected):
+        yield orjson.dumps(processed_contact) + b"\n"
+
+    yield orjson.dumps({
+        "statistics": stats,
+        "metadata": {
+            "response_time_ms": (time.perf_counter_ns() - start_time) // 1_000_000,
+            "timestamp": now_iso,
+            "request_id": request_id
+        }
+    }) + b"\n"
+
+
+async def _fetch_contacts(
+    waha_client: WahaClient,
+    *,
+    limit: int,
+    offset: int,
+    sort_by: str,
+    sort_order: str,
+    session: str,
+    use_mock: bool,
+    cursor: Optional[str],
+    fields: Optional[str],
+    request_id: Optional[str],
+    now_iso: str,
+    stream: bool = False,
+    response: Optional[Response] = None
+) -> Any:
+    """Fetch, enrich and paginate contacts; shared by the GET and POST routes"""
+    start_time = time.perf_counter_ns()
+
+    decoded_cursor = _decode_cursor(cursor, sort_by, sort_order) if cursor else None
+    selected = _parse_fields(fields) if fields else None
+    if decoded_cursor is None and offset > settings.OFFSET_WARN_THRESHOLD and response is not None:
+        response.headers["Deprecation"] = "true"
+        response.headers["Warning"] = '299 - "Deep offset pagination is deprecated, use cursor"'
 
-        # Initialize WAHA client
-        waha_client = WahaClient()
+    try:
+        logger.info("Getting contacts - limit: %d, offset: %d, sort_by: %s", limit, offset, sort_by)
 
         # Get contacts
         waha_response = await waha_client.get_all_contacts(
@@ -87,40 +264,21 @@ async def get_contacts(
             sort_by=sort_by,
             sort_order=sort_order,
             session=session,
-            use_mock=use_mock
+            use_mock=use_mock,
+            cursor=decoded_cursor
         )
 
-        response_time = int((time.time() - start_time) * 1000)
+        response_time = (time.perf_counter_ns() - start_time) // 1_000_000
 
         if not waha_response.success:
             # Handle specific WAHA errors
             error_code = waha_response.code
             if error_code == "SCAN_QR_REQUIRED":
-                raise HTTPException(
-                    status_code=422,
-                    detail={
-                        "success": False,
-                        "error": "WhatsApp session needs QR code scan",
-                        "code": "SCAN_QR_REQUIRED",
-                        "details": {
-                            "message": "Please scan QR code in WAHA dashboard",
-                            "waha_url": f"{settings.WAHA_API_URL}/"
-                        }
-                    }
-                )
+                raise HTTPException(status_code=422, detail=SCAN_QR_DETAIL)
             elif error_code == "SESSION_DISCONNECTED":
-                raise HTTPException(
-                    status_code=422,
-                    detail={
-                        "success": False,
-                        "error": "WhatsApp session is disconnected",
-                        "code": "SESSION_DISCONNECTED",
-                        "details": {
-                            "message": "Please reconnect WhatsApp session",
-                            "session": session
-                        }
-                    }
-                )
+                detail = {**SESSION_DISCONNECTED_DETAIL}
+                detail["details"] = {**detail["details"], "session": session}
+                raise HTTPException(status_code=422, detail=detail)
             else:
                 raise HTTPException(
                     status_code=500 if not error_code else 503,
@@ -130,7 +288,7 @@ async def get_contacts(
                         "code": error_code or "CONTACTS_ERROR",
                         "metadata": {
                             "response_time_ms": response_time,
-                            "timestamp": settings.get_current_time()
+                            "timestamp": now_iso
                         }
                     }
                 )
@@ -139,70 +297,67 @@ async def get_contacts(
         contacts_data = waha_response.data
         contacts = contacts_data.get("contacts", [])
 
-        # Process and enrich contacts
-        processed_contacts = []
-        for contact in contacts:
-            processed_contact = {
-                "id": contact.get("id"),
-                "name": contact.get("name") or contact.get("pushname") or contact.get("notifyName") or "Unknown",
-                "display_name": contact.get("pushname") or contact.get("notifyName") or contact.get("name") or "Unknown",
-                "is_group": contact.get("isGroup", False),
-                "is_wa_contact": contact.get("isWAContact", False),
-                "last_message": contact.get("lastMessage"),
-                "last_message_time": contact.get("lastMessageTime"),
-                "unread_count": contact.get("unreadCount", 0),
-                "profile_pic_url": contact.get("profilePicUrl"),
-                "phone": contact.get("id", "").replace("@c.us", "").replace("@g.us", ""),
-                "type": "group" if contact.get("isGroup") else "individual",
-                "notify_name": contact.get("notifyName"),
-                "pushname": contact.get("pushname")
-            }
-            processed_contacts.append(processed_contact)
-
-        # Calculate statistics
-        stats = {
-            "total": len(processed_contacts),
-            "individuals": len([c for c in processed_contacts if c["type"] == "individual"]),
-            "groups": len([c for c in processed_contacts if c["type"] == "group"]),
-            "wa_contacts": len([c for c in processed_contacts if c["is_wa_contact"]]),
-            "with_unread": len([c for c in processed_contacts if c["unread_count"] > 0]),
-            "total_unread": sum(c["unread_count"] for c in processed_contacts)
-        }
+        # Get pagination data (authoritative values from WAHA only)
+        if decoded_cursor:
+            offset = contacts_data.get("offset", decoded_cursor["offset"])
+        total = contacts_data.get("total")
+        has_more = contacts_data.get("has_more")
+        total_pages = contacts_data.get("pagination", {}).get("total_pages")
+        if total is None or has_more is None or total_pages is None:
+            raise HTTPException(status_code=502, detail=_UPSTREAM_CONTRACT_DETAIL)
 
-        # Get pagination data
-        pagination_data = contacts_data.get("pagination", {})
         pagination = {
             "limit": limit,
             "offset": offset,
-            "total": contacts_data.get("total", len(processed_contacts)),
-            "has_more": contacts_data.get("has_more", len(processed_contacts) >= limit),
+            "total": total,
+            "has_more": has_more,
             "page": (offset // limit) + 1,
-            "total_pages": pagination_data.get("total_pages", (len(processed_contacts) + limit - 1) // limit)
+            "total_pages": total_pages,
+            "next_cursor": _encode_cursor(
+                contacts[-1].get(sort_by), contacts[-1].get("id"), offset + len(contacts), sort_by, sort_order
+            ) if has_more and contacts else None
         }
 
-        return JSONResponse(
-            status_code=200,
-            content={
-                "success": True,
-                "data": {
-                    "contacts": processed_contacts,
-                    "pagination": pagination,
-                    "sorting": {
-                        "sort_by": sort_by,
-                        "sort_order": sort_order
-                    },
-                    "session": session,
-                    "statistics": stats,
-                    "mock": contacts_data.get("mock", False),
-                    "generated_at": contacts_data.get("generated_at", settings.get_current_time())
-                },
-                "metadata": {
-                    "response_time_ms": response_time,
-                    "timestamp": settings.get_current_time(),
-                    "request_id": getattr(request.state, "request_id", None)
-                }
+        sorting = {
+            "sort_by": sort_by,
+            "sort_order": sort_order
+        }
+
+        if stream:
+            # Carry over headers set on the injected response (e.g. Deprecation); its content-length is for an empty body
+            headers = {
+                key: value for key, value in response.headers.items() if key != "content-length"
+            } if response is not None else None
+            return StreamingResponse(
+                _stream_contacts_ndjson(
+                    request_id, contacts, contacts_data, pagination, sorting, session, start_time, now_iso, selected
+                ),
+                media_type=_NDJSON_MEDIA_TYPE,
+                headers=headers
+            )
+
+        # Process and enrich contacts, accumulating statistics in the same pass
+        stats = {}
+        processed_contacts = list(_iter_processed_contacts(contacts, stats, selected))
+        response_time = (time.perf_counter_ns() - start_time) // 1_000_000
+
+        return {
+            "success": True,
+            "data": {
+                "contacts": processed_contacts,
+                "pagination": pagination,
+                "sorting": sorting,
+                "session": session,
+                "statistics": stats,
+                "mock": contacts_data.get("mock", False),
+                "generated_at": contacts_data.get("generated_at", now_iso)
+            },
+            "metadata": {
+                "response_time_ms": response_time,
+                "timestamp": now_iso,
+                "request_id": request_id
             }
-        )
+        }
 
     except HTTPException:
         raise
@@ -217,90 +372,134 @@ async def get_contacts(
                     "error": str(e)
                 } if settings.DEBUG else None,
                 "metadata": {
-                    "response_time_ms": int((time.time() - start_time) * 1000),
-                    "timestamp": settings.get_current_time(),
-                    "request_id": getattr(request.state, "request_id", None)
+                    "response_time_ms": (time.perf_counter_ns() - start_time) // 1_000_000,
+                    "timestamp": now_iso,
+                    "request_id": request_id
                 }
             }
         )
 
 
+@router.get("/contacts", summary="Get WhatsApp Contacts")
+async def get_contacts(
+    request: Request,
+    response: Response,
+    limit: int = Query(100, ge=1, le=settings.MAX_LIMIT, description="Number of contacts to retrieve"),
+    offset: int = Query(0, ge=0, description="Offset for pagination"),
+    sort_by: ContactSortField = Query("name", description="Field to sort by"),
+    sort_order: SortOrder = Query("asc", description="Sort order"),
+    session: str = Query("default", description="WAHA session name"),
+    use_mock: bool = Query(False, description="Use mock data for testing"),
+    cursor: Optional[str] = Query(None, description="Keyset pagination cursor (pagination.next_cursor)"),
+    fields: Optional[str] = Query(None, description="Comma-separated contact fields to return (e.g. id,name,unread_count)"),
+    waha_client: WahaClient = Depends(get_waha_client)
+) -> Dict[str, Any]:
+    """
+    Retrieve WhatsApp contacts from WAHA API
+
+    - **limit**: Number of contacts to retrieve (max 1000)
+    - **offset**: Pagination offset (deprecated for deep pages, use cursor)
+    - **sort_by**: Field to sort contacts by
+    - **sort_order**: Sort direction (asc/desc)
+    - **session**: WAHA session name
+    - **use_mock**: Use mock data for testing
+    - **cursor**: Opaque cursor from a previous page's `pagination.next_cursor`
+    - **fields**: Comma-separated subset of contact fields to return
+    """
+    return await _fetch_contacts(
+        waha_client,
+        limit=limit,
+        offset=offset,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        session=session,
+        use_mock=use_mock,
+        cursor=cursor,
+        fields=fields,
+        request_id=getattr(request.state, "request_id", None),
+        now_iso=settings.get_current_time(),
+        stream=_NDJSON_MEDIA_TYPE in request.headers.get("accept", ""),
+        response=response
+    )
+
+
+async def _compute_contact_statistics(waha_client: WahaClient, session: str = "default") -> Dict[str, Any]:
+    """Fetch contacts from WAHA and compute statistics and unread distribution"""
+    # Get all contacts with higher limit
+    waha_response = await waha_client.get_all_contacts(
+        limit=1000,
+        offset=0,
+        sort_by="name",
+        sort_order="asc",
+        session=session,
+        use_mock=False
+    )
+
+    if not waha_response.success:
+        raise HTTPException(status_code=503, detail=_STATISTICS_UNAVAILABLE_DETAIL)
+
+    contacts = waha_response.data.get("contacts", [])
+
+    # Calculate detailed statistics and unread distribution in a single pass
+    group_chats = wa_contacts = with_unread = total_unread = with_profile_pic = 0
+    distribution_counts = [0] * len(_UNREAD_KEYS)
+    for contact in contacts:
+        if contact.get("isGroup", False):
+            group_chats += 1
+        if contact.get("isWAContact", False):
+            wa_contacts += 1
+        if contact.get("profilePicUrl"):
+            with_profile_pic += 1
+
+        unread_count = contact.get("unreadCount", 0)
+        total_unread += unread_count
+        if unread_count > 0:
+            with_unread += 1
+        distribution_counts[bisect_left(_UNREAD_BUCKETS, unread_count)] += 1
+
+    # Get unread distribution
+    unread_distribution = dict(zip(_UNREAD_KEYS, distribution_counts))
+
+    total_contacts = len(contacts)
+    stats = {
+        "total_contacts": total_contacts,
+        "individual_contacts": total_contacts - group_chats,
+        "group_chats": group_chats,
+        "wa_contacts": wa_contacts,
+        "non_wa_contacts": total_contacts - wa_contacts,
+        "contacts_with_unread": with_unread,
+        "total_unread_messages": total_unread,
+        "contacts_with_profile_pic": with_profile_pic,
+        "average_unread_per_contact": total_unread / total_contacts if total_contacts > 0 else 0
+    }
+
+    return {
+        "statistics": stats,
+        "unread_distribution": unread_distribution,
+        "last_updated": settings.get_current_time(),
+        "session": session
+    }
+
+
 @router.get("/contacts/statistics", summary="Get Contact Statistics")
-async def get_contact_statistics(request: Request) -> Dict[str, Any]:
+async def get_contact_statistics(
+    request: Request,
+    waha_client: WahaClient = Depends(get_waha_client)
+) -> Dict[str, Any]:
     """
     Get statistics about WhatsApp contacts
     """
     try:
-        # Get all contacts with higher limit
-        waha_client = WahaClient()
-        waha_response = await waha_client.get_all_contacts(
-            limit=1000,
-            offset=0,
-            sort_by="name",
-            sort_order="asc",
-            session="default",
-            use_mock=False
-        )
-
-        if not waha_response.success:
-            raise HTTPException(
-                status_code=503,
-                detail={
-                    "success": False,
-                    "error": "Unable to retrieve contacts for statistics",
-                    "code": "STATISTICS_ERROR"
-                }
+        if settings.CACHE_ENABLED:
+            data = await _statistics_cache.get_or_set(
+                "default", lambda: _compute_contact_statistics(waha_client)
             )
-
-        contacts = waha_response.data.get("contacts", [])
-
-        # Calculate detailed statistics
-        stats = {
-            "total_contacts": len(contacts),
-            "individual_contacts": len([c for c in contacts if not c.get("isGroup", False)]),
-            "group_chats": len([c for c in contacts if c.get("isGroup", False)]),
-            "wa_contacts": len([c for c in contacts if c.get("isWAContact", False)]),
-            "non_wa_contacts": len([c for c in contacts if not c.get("isWAContact", False)]),
-            "contacts_with_unread": len([c for c in contacts if c.get("unreadCount", 0) > 0]),
-            "total_unread_messages": sum(c.get("unreadCount", 0) for c in contacts),
-            "contacts_with_profile_pic": len([c for c in contacts if c.get("profilePicUrl")]),
-            "average_unread_per_contact": 0
-        }
-
-        # Calculate average unread per contact
-        if stats["total_contacts"] > 0:
-            stats["average_unread_per_contact"] = stats["total_unread_messages"] / stats["total_contacts"]
-
-        # Get unread distribution
-        unread_distribution = {
-            "zero_unread": 0,
-            "1_to_5_unread": 0,
-            "6_to_10_unread": 0,
-            "11_to_50_unread": 0,
-            "more_than_50_unread": 0
-        }
-
-        for contact in contacts:
-            unread_count = contact.get("unreadCount", 0)
-            if unread_count == 0:
-                unread_distribution["zero_unread"] += 1
-            elif unread_count <= 5:
-                unread_distribution["1_to_5_unread"] += 1
-            elif unread_count <= 10:
-                unread_distribution["6_to_10_unread"] += 1
-            elif unread_count <= 50:
-                unread_distribution["11_to_50_unread"] += 1
-            else:
-                unread_distribution["more_than_50_unread"] += 1
+        else:
+            data = await _compute_contact_statistics(waha_client)
 
         return {
             "success": True,
-            "data": {
-                "statistics": stats,
-                "unread_distribution": unread_distribution,
-                "last_updated": settings.get_current_time(),
-                "session": "default"
-            },
+            "data": data,
             "metadata": {
                 "timestamp": settings.get_current_time(),
                 "request_id": getattr(request.state, "request_id", None)
@@ -327,24 +526,26 @@ async def get_contact_statistics(request: Request) -> Dict[str, Any]:
 async def get_mock_contacts(
     request: Request,
     limit: int = Query(100, ge=1, le=settings.MAX_LIMIT),
-    sort_by: str = Query("name", regex="^(name|id|notifyName|pushname|lastMessage|unreadCount|lastMessageTime)$"),
-    sort_order: str = Query("asc", regex="^(asc|desc)$")
+    sort_by: ContactSortField = Query("name"),
+    sort_order: SortOrder = Query("asc"),
+    waha_client: WahaClient = Depends(get_waha_client)
 ) -> Dict[str, Any]:
     """
     Get mock contacts for testing purposes
     """
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
 
     try:
-        waha_client = WahaClient()
         mock_data = waha_client._generate_mock_contacts(limit, 0, sort_by, sort_order)
+        mock_contacts = mock_data["contacts"]
+        groups = sum(1 for contact in mock_contacts if contact.get("isGroup", False))
 
-        response_time = int((time.time() - start_time) * 1000)
+        response_time = (time.perf_counter_ns() - start_time) // 1_000_000
 
         return {
             "success": True,
             "data": {
-                "contacts": mock_data["contacts"],
+                "contacts": mock_contacts,
                 "total": mock_data["total"],
                 "limit": limit,
                 "has_more": mock_data["has_more"],
@@ -352,8 +553,8 @@ async def get_mock_contacts(
                 "generated_at": mock_data["generated_at"],
                 "statistics": {
                     "total": mock_data["total"],
-                    "individuals": len([c for c in mock_data["contacts"] if not c.get("isGroup", False)]),
-                    "groups": len([c for c in mock_data["contacts"] if c.get("isGroup", False)])
+                    "individuals": len(mock_contacts) - groups,
+                    "groups": groups
                 }
             },
             "metadata": {
@@ -380,17 +581,25 @@ async def get_mock_contacts(
 @router.post("/contacts", summary="Get Contacts with POST")
 async def get_contacts_post(
     request: Request,
-    contact_request: ContactRequest
+    response: Response,
+    contact_request: ContactRequest,
+    waha_client: WahaClient = Depends(get_waha_client)
 ) -> Dict[str, Any]:
     """
     Get contacts using POST method for complex queries
     """
-    return await get_contacts(
-        request=request,
+    return await _fetch_contacts(
+        waha_client,
         limit=contact_request.limit,
         offset=contact_request.offset,
         sort_by=contact_request.sort_by,
         sort_order=contact_request.sort_order,
         session=contact_request.session,
-        use_mock=contact_request.use_mock
+        use_mock=contact_request.use_mock,
+        cursor=contact_request.cursor,
+        fields=contact_request.fields,
+        request_id=getattr(request.state, "request_id", None),
+        now_iso=settings.get_current_time(),
+        stream=_NDJSON_MEDIA_TYPE in request.headers.get("accept", ""),
+        response=response
     )
\ No newline at end of file
@@ -2,48 +2,108 @@
 Health Check Routes
 """
 
+import asyncio
 import time
 from datetime import datetime
 from typing import Dict, Any
 
-from fastapi import APIRouter, Request, Depends, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Request, Response, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 
+from api.core.cache import AsyncTTLCache
 from api.core.config import settings
-from api.core.waha_client import WahaClient, WahaResponse
+from api.core.waha_client import WahaClient, WahaResponse, get_waha_client
 from api.core.exceptions import WAHAException
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+_connection_cache = AsyncTTLCache(ttl=settings.HEALTH_CACHE_TTL_SECONDS, timeout=settings.WAHA_TIMEOUT)
+
+_REQUIRED_ENV_VARS = ('WAHA_API_URL', 'WAHA_USERNAME', 'WAHA_PASSWORD', 'WAHA_API_KEY')
+
+
+async def _test_waha_connection(waha_client: WahaClient) -> WahaResponse:
+    """Test the WAHA connection, reusing the result for HEALTH_CACHE_TTL_SECONDS"""
+    if not settings.CACHE_ENABLED:
+        return await waha_client.test_connection()
+    return await _connection_cache.get_or_set(waha_client.base_url, waha_client.test_connection)
+
+
+async def _probe_waha(waha_client: WahaClient) -> Dict[str, Any]:
+    """Probe the WAHA API connection"""
+    waha_response = await _test_waha_connection(waha_client)
+    return {
+        "status": "connected" if waha_response.success else "disconnected",
+        "url": settings.WAHA_API_URL,
+        "error": None if waha_response.success else waha_response.error
+    }
+
+
+async def _probe_environment() -> Dict[str, Any]:
+    """Check that the required WAHA settings are configured"""
+    missing_env_vars = [var for var in _REQUIRED_ENV_VARS if not getattr(settings, var, None)]
+    return {
+        "status": "configured" if len(missing_env_vars) == 0 else "misconfigured",
+        "missing": missing_env_vars,
+        "configured": [var for var in _REQUIRED_ENV_VARS if getattr(settings, var, None)]
+    }
+
+
+async def _probe_features() -> Dict[str, Any]:
+    """Report which optional features are enabled"""
+    return {
+        "authentication": bool(settings.JWT_SECRET and settings.API_SECRET_KEY),
+        "rate_limiting": settings.RATE_LIMIT_ENABLED,
+        "auto_response": settings.AUTO_RESPONSE_ENABLED,
+        "webhook": bool(settings.WEBHOOK_SECRET),
+        "logging": True,
+        "cache": settings.CACHE_ENABLED,
+        "metrics": settings.METRICS_ENABLED
+    }
 
 
 @router.get("/health", summary="Health Check Endpoint")
-async def health_check(request: Request) -> Dict[str, Any]:
+async def health_check(
+    request: Request,
+    response: Response,
+    waha_client: WahaClient = Depends(get_waha_client)
+) -> Dict[str, Any]:
     """
     Comprehensive health check for the WAHA FastAPI service
 
     Returns system status, WAHA API connection, and configuration details.
     """
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     timestamp = settings.get_current_time()
 
     try:
-        # Initialize WAHA client
-        waha_client = WahaClient()
-
-        # Test WAHA connection
-        waha_response = await waha_client.test_connection()
+        # Run all health probes concurrently; a failing probe marks only its service unhealthy
+        waha_service, environment_service, features = await asyncio.gather(
+            _probe_waha(waha_client),
+            _probe_environment(),
+            _probe_features(),
+            return_exceptions=True
+        )
 
-        # Get environment variables check
-        required_env_vars = ['WAHA_API_URL', 'WAHA_USERNAME', 'WAHA_PASSWORD', 'WAHA_API_KEY']
-        missing_env_vars = [var for var in required_env_vars if not getattr(settings, var, None)]
+        if isinstance(waha_service, Exception):
+            waha_service = {
+                "status": "disconnected",
+                "url": settings.WAHA_API_URL,
+                "error": str(waha_service)
+            }
+        if isinstance(environment_service, Exception):
+            environment_service = {"status": "error", "error": str(environment_service)}
+        if isinstance(features, Exception):
+            features = {}
 
         # Calculate response time
-        response_time = int((time.time() - start_time) * 1000)
+        response_time = (time.perf_counter_ns() - start_time) // 1_000_000
+        waha_service["response_time_ms"] = response_time
 
         # Determine overall health status
         is_healthy = (
-            waha_response.success and
-            len(missing_env_vars) == 0
+            waha_service["status"] == "connected" and
+            environment_service["status"] == "configured"
         )
 
         health_data = {
@@ -53,27 +113,10 @@ async def health_check(request: Request) -> Dict[str, Any]:
             "version": settings.APP_VERSION,
             "environment": settings.ENVIRONMENT,
             "services": {
-                "waha_api": {
-                    "status": "connected" if waha_response.success else "disconnected",
-                    "url": settings.WAHA_API_URL,
-                    "error": None if waha_response.success else waha_response.error,
-                    "response_time_ms": response_time
-                },
-                "environment": {
-                    "status": "configured" if len(missing_env_vars) == 0 else "misconfigured",
-                    "missing": missing_env_vars,
-                    "configured": [var for var in required_env_vars if getattr(settings, var, None)]
-                }
-            },
-            "features": {
-                "authentication": bool(settings.JWT_SECRET and settings.API_SECRET_KEY),
-                "rate_limiting": settings.RATE_LIMIT_ENABLED,
-                "auto_response": settings.AUTO_RESPONSE_ENABLED,
-                "webhook": bool(settings.WEBHOOK_SECRET),
-                "logging": True,
-                "cache": settings.CACHE_ENABLED,
-                "metrics": settings.METRICS_ENABLED
+                "waha_api": waha_service,
+                "environment": environment_service
             },
+            "features": features,
             "endpoints": {
                 "health": "/api/waba/health",
                 "messages": "/api/waba/messages",
@@ -89,16 +132,13 @@ async def health_check(request: Request) -> Dict[str, Any]:
         }
 
         # Set appropriate status code
-        status_code = 200 if is_healthy else 503
-
-        return JSONResponse(
-            status_code=status_code,
-            content={
-                "success": is_healthy,
-                "data": health_data,
-                "message": "All systems operational" if is_healthy else "Some services are down"
-            }
-        )
+        response.status_code = 200 if is_healthy else 503
+
+        return {
+            "success": is_healthy,
+            "data": health_data,
+            "message": "All systems operational" if is_healthy else "Some services are down"
+        }
 
     except WAHAException as e:
         raise HTTPException(
@@ -112,7 +152,7 @@ async def health_check(request: Request) -> Dict[str, Any]:
                     "code": e.code
                 } if settings.DEBUG else None,
                 "timestamp": timestamp,
-                "response_time_ms": int((time.time() - start_time) * 1000)
+                "response_time_ms": (time.perf_counter_ns() - start_time) // 1_000_000
             }
         )
     except Exception as e:
@@ -126,19 +166,18 @@ async def health_check(request: Request) -> Dict[str, Any]:
                     "error": str(e)
                 } if settings.DEBUG else None,
                 "timestamp": timestamp,
-                "response_time_ms": int((time.time() - start_time) * 1000)
+                "response_time_ms": (time.perf_counter_ns() - start_time) // 1_000_000
             }
         )
 
 
 @router.get("/health/waha", summary="WAHA API Health Check")
-async def waha_health_check() -> Dict[str, Any]:
+async def waha_health_check(waha_client: WahaClient = Depends(get_waha_client)) -> Dict[str, Any]:
     """
     Specific health check for WAHA API connection only
     """
     try:
-        waha_client = WahaClient()
-        waha_response = await waha_client.test_connection()
+        waha_response = await _test_waha_connection(waha_client)
 
         return {
             "success": True,
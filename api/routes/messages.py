@@ -2,150 +2,86 @@
 Messages Routes
 """
 
+import logging
 import time
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Literal, Optional
 
 from fastapi import APIRouter, Request, Depends, HTTPException, Query
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, validator
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from api.core.config import settings
-from api.core.waha_client import WahaClient
-from api.core.exceptions import WAHAException, WAHASessionException
+from api.core.validation import SortOrder, is_valid_chat_id
+from api.core.waha_client import WahaClient, WahaResponse, generate_mock_messages, get_waha_client
+from api.core.exceptions import SCAN_QR_DETAIL, SESSION_DISCONNECTED_DETAIL, WAHAException, WAHASessionException
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+logger = logging.getLogger(__name__)
+
+
+MessageSortField = Literal["timestamp", "from", "to", "body"]
 
 
 class MessageRequest(BaseModel):
     """Request model for getting messages"""
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
+
     chat_id: str
-    limit: int = 100
-    offset: int = 0
-    sort_by: str = "timestamp"
-    sort_order: str = "desc"
+    limit: int = Field(100, ge=1, le=settings.MAX_LIMIT)
+    offset: int = Field(0, ge=0)
+    sort_by: MessageSortField = "timestamp"
+    sort_order: SortOrder = "desc"
     session: str = "default"
     use_mock: bool = False
 
-    @validator('chat_id')
+    @field_validator('chat_id')
+    @classmethod
     def validate_chat_id(cls, v):
-        if not v.endswith('@c.us'):
-            raise ValueError('Chat ID must end with @c.us')
-        return v
-
-    @validator('limit')
-    def validate_limit(cls, v):
-        if v <= 0 or v > settings.MAX_LIMIT:
-            raise ValueError(f'Limit must be between 1 and {settings.MAX_LIMIT}')
-        return v
-
-    @validator('offset')
-    def validate_offset(cls, v):
-        if v < 0:
-            raise ValueError('Offset must be non-negative')
-        return v
-
-    @validator('sort_by')
-    def validate_sort_by(cls, v):
-        allowed = ['timestamp', 'from', 'to', 'body']
-        if v not in allowed:
-            raise ValueError(f'Sort by must be one of: {", ".join(allowed)}')
-        return v
-
-    @validator('sort_order')
-    def validate_sort_order(cls, v):
-        if v not in ['asc', 'desc']:
-            raise ValueError('Sort order must be asc or desc')
+        if not is_valid_chat_id(v):
+            raise ValueError('Chat ID must be digits followed by @c.us')
         return v
 
 
-@router.get("/messages", summary="Get Chat Messages")
-async def get_chat_messages(
-    request: Request,
-    chat_id: str = Query(..., description="Chat ID (format: 628123456789@c.us)"),
-    limit: int = Query(100, ge=1, le=settings.MAX_LIMIT, description="Number of messages to retrieve"),
-    offset: int = Query(0, ge=0, description="Offset for pagination"),
-    sort_by: str = Query("timestamp", regex="^(timestamp|from|to|body)$", description="Field to sort by"),
-    sort_order: str = Query("desc", regex="^(asc|desc)$", description="Sort order"),
-    session: str = Query("default", description="WAHA session name"),
-    use_mock: bool = Query(False, description="Use mock data for testing")
-) -> Dict[str, Any]:
-    """
-    Retrieve messages from a specific WhatsApp chat
-
-    - **chat_id**: WhatsApp chat ID in format 628123456789@c.us
-    - **limit**: Number of messages to retrieve (max 1000)
-    - **offset**: Pagination offset
-    - **sort_by**: Field to sort messages by
-    - **sort_order**: Sort direction (asc/desc)
-    - **session**: WAHA session name
-    - **use_mock**: Use mock data for testing
-    """
-    start_time = time.time()
+async def _fetch_messages(
+    waha_client: WahaClient,
+    params: MessageRequest,
+    *,
+    request_id: Optional[str],
+    now_iso: str
+) -> Any:
+    """Fetch chat messages from WAHA; params are validated by the calling route"""
+    start_time = time.perf_counter_ns()
+    chat_id, limit, offset = params.chat_id, params.limit, params.offset
+    sort_by, sort_order, session = params.sort_by, params.sort_order, params.session
 
     try:
-        # Validate chat ID format
-        if not chat_id.endswith('@c.us'):
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "success": False,
-                    "error": "Invalid chat ID format",
-                    "code": "INVALID_CHAT_ID",
-                    "details": {
-                        "required_format": "628123456789@c.us",
-                        "provided": chat_id
-                    }
-                }
-            )
-
-        logger.info(f"Getting messages for chat: {chat_id}, limit: {limit}, offset: {offset}")
-
-        # Initialize WAHA client
-        waha_client = WahaClient()
+        logger.info("Getting messages for chat: %s, limit: %d, offset: %d", chat_id, limit, offset)
 
-        # Get messages
-        waha_response = await waha_client.get_chat_messages(
-            chat_id=chat_id,
-            limit=limit,
-            offset=offset,
-            sort_by=sort_by,
-            sort_order=sort_order,
-            session=session,
-            use_mock=use_mock
-        )
+        # Get messages (mock data is generated locally, without the WAHA client)
+        if params.use_mock:
+            waha_response = WahaResponse(success=True, data=generate_mock_messages(chat_id, limit))
+        else:
+            waha_response = await waha_client.get_chat_messages(
+                chat_id=chat_id,
+                limit=limit,
+                offset=offset,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                session=session
+            )
 
-        response_time = int((time.time() - start_time) * 1000)
+        response_time = (time.perf_counter_ns() - start_time) // 1_000_000
 
         if not waha_response.success:
             # Handle specific WAHA errors
             error_code = waha_response.code
             if error_code == "SCAN_QR_REQUIRED":
-                raise HTTPException(
-                    status_code=422,
-                    detail={
-                        "success": False,
-                        "error": "WhatsApp session needs QR code scan",
-                        "code": "SCAN_QR_REQUIRED",
-                        "details": {
-                            "message": "Please scan QR code in WAHA dashboard",
-                            "waha_url": f"{settings.WAHA_API_URL}/"
-                        }
-                    }
-                )
+                raise HTTPException(status_code=422, detail=SCAN_QR_DETAIL)
             elif error_code == "SESSION_DISCONNECTED":
-                raise HTTPException(
-                    status_code=422,
-                    detail={
-                        "success": False,
-                        "error": "WhatsApp session is disconnected",
-                        "code": "SESSION_DISCONNECTED",
-                        "details": {
-                            "message": "Please reconnect WhatsApp session",
-                            "session": session
-                        }
-                    }
-                )
+                detail = {**SESSION_DISCONNECTED_DETAIL}
+                detail["details"] = {**detail["details"], "session": session}
+                raise HTTPException(status_code=422, detail=detail)
             else:
                 raise HTTPException(
                     status_code=500 if not error_code else 503,
@@ -155,7 +91,7 @@ async def get_chat_messages(
                         "code": error_code or "MESSAGES_ERROR",
                         "metadata": {
                             "response_time_ms": response_time,
-                            "timestamp": settings.get_current_time()
+                            "timestamp": now_iso
                         }
                     }
                 )
@@ -164,56 +100,113 @@ async def get_chat_messages(
         messages_data = waha_response.data
         messages = messages_data.get("messages", [])
 
-        return JSONResponse(
-            status_code=200,
-            content={
-                "success": True,
-                "data": {
-                    "chat_id": chat_id,
-                    "messages": messages,
-                    "pagination": messages_data.get("pagination", {
-                        "limit": limit,
-                        "offset": offset,
-                        "has_more": len(messages) >= limit,
-                        "page": (offset // limit) + 1,
-                        "total_pages": (len(messages) + limit - 1) // limit
-                    }),
-                    "sorting": {
-                        "sort_by": sort_by,
-                        "sort_order": sort_order
-                    },
-                    "session": session,
-                    "mock": messages_data.get("mock", False),
-                    "total": len(messages)
+        message_count = len(messages)
+
+        # Fall back to local pagination only when WAHA does not provide it
+        pagination = messages_data.get("pagination")
+        if pagination is None:
+            pagination = {
+                "limit": limit,
+                "offset": offset,
+                "has_more": message_count >= limit,
+                "page": offset // limit + 1,
+                "total_pages": -(-message_count // limit)
+            }
+
+        return ORJSONResponse({
+            "success": True,
+            "data": {
+                "chat_id": chat_id,
+                "messages": messages,
+                "pagination": pagination,
+                "sorting": {
+                    "sort_by": sort_by,
+                    "sort_order": sort_order
                 },
-                "metadata": {
-                    "response_time_ms": response_time,
-                    "timestamp": settings.get_current_time(),
-                    "request_id": getattr(request.state, "request_id", None)
-                }
+                "session": session,
+                "mock": messages_data.get("mock", False),
+                "total": message_count
+            },
+            "metadata": {
+                "response_time_ms": response_time,
+                "timestamp": now_iso,
+                "request_id": request_id
             }
-        )
+        })
 
     except HTTPException:
         raise
     except Exception as e:
+        detail = {
+            "success": False,
+            "error": "Internal server error",
+            "code": "INTERNAL_ERROR",
+            "metadata": {
+                "response_time_ms": (time.perf_counter_ns() - start_time) // 1_000_000,
+                "timestamp": now_iso,
+                "request_id": request_id
+            }
+        }
+        if settings.DEBUG:
+            detail["details"] = {"error": str(e)}
+        raise HTTPException(status_code=500, detail=detail)
+
+
+@router.get("/messages", summary="Get Chat Messages")
+async def get_chat_messages(
+    request: Request,
+    chat_id: str = Query(..., description="Chat ID (format: 628123456789@c.us)"),
+    limit: int = Query(100, ge=1, le=settings.MAX_LIMIT, description="Number of messages to retrieve"),
+    offset: int = Query(0, ge=0, description="Offset for pagination"),
+    sort_by: MessageSortField = Query("timestamp", description="Field to sort by"),
+    sort_order: SortOrder = Query("desc", description="Sort order"),
+    session: str = Query("default", description="WAHA session name"),
+    use_mock: bool = Query(False, description="Use mock data for testing"),
+    waha_client: WahaClient = Depends(get_waha_client)
+) -> Dict[str, Any]:
+    """
+    Retrieve messages from a specific WhatsApp chat
+
+    - **chat_id**: WhatsApp chat ID in format 628123456789@c.us
+    - **limit**: Number of messages to retrieve (max 1000)
+    - **offset**: Pagination offset
+    - **sort_by**: Field to sort messages by
+    - **sort_order**: Sort direction (asc/desc)
+    - **session**: WAHA session name
+    - **use_mock**: Use mock data for testing
+    """
+    # Validate chat ID format (the POST model validates it for the other route)
+    if not is_valid_chat_id(chat_id):
         raise HTTPException(
-            status_code=500,
+            status_code=400,
             detail={
                 "success": False,
-                "error": "Internal server error",
-                "code": "INTERNAL_ERROR",
+                "error": "Invalid chat ID format",
+                "code": "INVALID_CHAT_ID",
                 "details": {
-                    "error": str(e)
-                } if settings.DEBUG else None,
-                "metadata": {
-                    "response_time_ms": int((time.time() - start_time) * 1000),
-                    "timestamp": settings.get_current_time(),
-                    "request_id": getattr(request.state, "request_id", None)
+                    "required_format": "628123456789@c.us",
+                    "provided": chat_id
                 }
             }
         )
 
+    # Query parameters are already validated; skip a second pydantic pass
+    params = MessageRequest.model_construct(
+        chat_id=chat_id,
+        limit=limit,
+        offset=offset,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        session=session,
+        use_mock=use_mock
+    )
+    return await _fetch_messages(
+        waha_client,
+        params,
+        request_id=getattr(request.state, "request_id", None),
+        now_iso=settings.get_current_time()
+    )
+
 
 @router.get("/messages/mock", summary="Get Mock Messages")
 async def get_mock_messages(
@@ -224,13 +217,13 @@ async def get_mock_messages(
     """
     Get mock messages for testing purposes
     """
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
+    now_iso = settings.get_current_time()
 
     try:
-        waha_client = WahaClient()
-        mock_data = waha_client._generate_mock_messages(chat_id, limit)
+        mock_data = generate_mock_messages(chat_id, limit)
 
-        response_time = int((time.time() - start_time) * 1000)
+        response_time = (time.perf_counter_ns() - start_time) // 1_000_000
 
         return {
             "success": True,
@@ -244,40 +237,34 @@ async def get_mock_messages(
             },
             "metadata": {
                 "response_time_ms": response_time,
-                "timestamp": settings.get_current_time(),
+                "timestamp": now_iso,
                 "request_id": getattr(request.state, "request_id", None)
             }
         }
 
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "success": False,
-                "error": "Failed to generate mock messages",
-                "code": "MOCK_GENERATION_ERROR",
-                "details": {
-                    "error": str(e)
-                } if settings.DEBUG else None
-            }
-        )
+        detail = {
+            "success": False,
+            "error": "Failed to generate mock messages",
+            "code": "MOCK_GENERATION_ERROR"
+        }
+        if settings.DEBUG:
+            detail["details"] = {"error": str(e)}
+        raise HTTPException(status_code=500, detail=detail)
 
 
 @router.post("/messages", summary="Get Messages with POST")
 async def get_messages_post(
     request: Request,
-    message_request: MessageRequest
+    message_request: MessageRequest,
+    waha_client: WahaClient = Depends(get_waha_client)
 ) -> Dict[str, Any]:
     """
     Get messages using POST method for complex queries
     """
-    return await get_chat_messages(
-        request=request,
-        chat_id=message_request.chat_id,
-        limit=message_request.limit,
-        offset=message_request.offset,
-        sort_by=message_request.sort_by,
-        sort_order=message_request.sort_order,
-        session=message_request.session,
-        use_mock=message_request.use_mock
+    return await _fetch_messages(
+        waha_client,
+        message_request,
+        request_id=getattr(request.state, "request_id", None),
+        now_iso=settings.get_current_time()
     )
\ No newline at end of file
@@ -2,49 +2,79 @@
 Send Message Routes
 """
 
+import asyncio
+import logging
+import re
 import time
+import uuid
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Annotated, Dict, Any, List, Optional
 
 from fastapi import APIRouter, Request, Depends, HTTPException, Body
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field, validator
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter, ValidationError, ValidationInfo, field_validator
 
 from api.core.config import settings
-from api.core.waha_client import WahaClient
-from api.core.exceptions import WAHAException
+from api.core.validation import is_valid_chat_id
+from api.core.waha_client import WahaClient, get_waha_client
+from api.core.exceptions import SCAN_QR_DETAIL, SESSION_DISCONNECTED_DETAIL, WAHAException
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+logger = logging.getLogger(__name__)
+
+_MEDIA_URL_RE = re.compile(r"https?://[^\s/]+")
+
+StrippedStr = Annotated[str, StringConstraints(strip_whitespace=True)]
+
+
+def _compact(**fields) -> Dict[str, Any]:
+    """Build a dict from the given fields, leaving out None values"""
+    return {key: value for key, value in fields.items() if value is not None}
 
 
 class SendMessageRequest(BaseModel):
     """Request model for sending messages"""
-    chat_id: str = Field(..., description="Chat ID (format: 628123456789@c.us)")
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    # Only the identifiers are stripped; the message text is sent exactly as given
+    chat_id: StrippedStr = Field(..., description="Chat ID (format: 628123456789@c.us)")
     message: str = Field(..., min_length=1, max_length=4096, description="Message content")
-    session: str = Field("default", description="WAHA session name")
-    type: str = Field("text", regex="^(text|image|document|audio|video)$", description="Message type")
+    session: StrippedStr = Field("default", description="WAHA session name")
+    type: str = Field("text", pattern="^(text|image|document|audio|video)$", description="Message type")
     media_url: Optional[str] = Field(None, description="Media URL for media messages")
     media_caption: Optional[str] = Field(None, max_length=1024, description="Media caption")
 
-    @validator('chat_id')
+    @field_validator('chat_id')
+    @classmethod
     def validate_chat_id(cls, v):
-        if not v.endswith('@c.us'):
-            raise ValueError('Chat ID must end with @c.us')
+        if not is_valid_chat_id(v):
+            raise ValueError('Chat ID must be digits followed by @c.us')
         return v
 
-    @validator('media_url')
-    def validate_media_url(cls, v, values):
+    @field_validator('media_url')
+    @classmethod
+    def validate_media_url(cls, v, info: ValidationInfo):
         if v is None:
             return v
 
         # Check if media type requires media URL
-        message_type = values.get('type', 'text')
+        message_type = info.data.get('type', 'text')
         if message_type != 'text' and not v:
             raise ValueError('Media URL is required for media messages')
 
         return v
 
 
+# Validates a whole /send/batch body in one pydantic-core call
+_BATCH_ADAPTER = TypeAdapter(List[SendMessageRequest])
+_BATCH_BODY_SCHEMA = {
+    key: value
+    for key, value in _BATCH_ADAPTER.json_schema(ref_template="#/components/schemas/{model}").items()
+    if key != "$defs"
+}
+
+
 class SendMessageResponse(BaseModel):
     """Response model for sent message"""
     message_id: str
@@ -59,7 +89,8 @@ class SendMessageResponse(BaseModel):
 @router.post("/send", summary="Send WhatsApp Message")
 async def send_message(
     request: Request,
-    message_request: SendMessageRequest = Body(...)
+    message_request: SendMessageRequest = Body(...),
+    waha_client: WahaClient = Depends(get_waha_client)
 ) -> Dict[str, Any]:
     """
     Send a message via WhatsApp using WAHA API
@@ -71,7 +102,8 @@ async def send_message(
     - **media_url**: URL for media files (required for non-text messages)
     - **media_caption**: Caption for media files
     """
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
+    now_iso = settings.get_current_time()
 
     try:
         chat_id = message_request.chat_id
@@ -81,34 +113,25 @@ async def send_message(
         media_url = message_request.media_url
         media_caption = message_request.media_caption
 
-        logger.info(f"Sending {message_type} message to chat: {chat_id}")
+        logger.info("Sending %s message to chat: %s", message_type, chat_id)
 
         # Check if auto-response is enabled
         auto_response_enabled = settings.AUTO_RESPONSE_ENABLED
 
-        # Initialize WAHA client
-        waha_client = WahaClient()
-
         # Validate media URL for media messages
-        if message_type != 'text' and media_url:
-            try:
-                from urllib.parse import urlparse
-                parsed_url = urlparse(media_url)
-                if not parsed_url.scheme or not parsed_url.netloc:
-                    raise ValueError("Invalid URL format")
-            except Exception:
-                raise HTTPException(
-                    status_code=400,
-                    detail={
-                        "success": False,
-                        "error": "Invalid media URL format",
-                        "code": "INVALID_MEDIA_URL",
-                        "details": {
-                            "provided_url": media_url,
-                            "required_format": "Valid URL (http:// or https://)"
-                        }
+        if message_type != 'text' and media_url and not _MEDIA_URL_RE.match(media_url):
+            raise HTTPException(
+                status_code=400,
+                detail={
+                    "success": False,
+                    "error": "Invalid media URL format",
+                    "code": "INVALID_MEDIA_URL",
+                    "details": {
+                        "provided_url": media_url,
+                        "required_format": "Valid URL (http:// or https://)"
                     }
-                )
+                }
+            )
 
         # Send message
         waha_response = await waha_client.send_message(
@@ -120,37 +143,17 @@ async def send_message(
             media_caption=media_caption
         )
 
-        response_time = int((time.time() - start_time) * 1000)
+        response_time = (time.perf_counter_ns() - start_time) // 1_000_000
 
         if not waha_response.success:
             # Handle specific WAHA errors
             error_code = waha_response.code
             if error_code == "SCAN_QR_REQUIRED":
-                raise HTTPException(
-                    status_code=422,
-                    detail={
-                        "success": False,
-                        "error": "WhatsApp session needs QR code scan",
-                        "code": "SCAN_QR_REQUIRED",
-                        "details": {
-                            "message": "Please scan QR code in WAHA dashboard",
-                            "waha_url": f"{settings.WAHA_API_URL}/"
-                        }
-                    }
-                )
+                raise HTTPException(status_code=422, detail=SCAN_QR_DETAIL)
             elif error_code == "SESSION_DISCONNECTED":
-                raise HTTPException(
-                    status_code=422,
-                    detail={
-                        "success": False,
-                        "error": "WhatsApp session is disconnected",
-                        "code": "SESSION_DISCONNECTED",
-                        "details": {
-                            "message": "Please reconnect WhatsApp session",
-                            "session": session
-                        }
-                    }
-                )
+                detail = {**SESSION_DISCONNECTED_DETAIL}
+                detail["details"] = {**detail["details"], "session": session}
+                raise HTTPException(status_code=422, detail=detail)
             else:
                 raise HTTPException(
                     status_code=500 if not error_code else 503,
@@ -160,80 +163,119 @@ async def send_message(
                         "code": error_code or "SEND_MESSAGE_ERROR",
                         "metadata": {
                             "response_time_ms": response_time,
-                            "timestamp": settings.get_current_time()
+                            "timestamp": now_iso
                         }
                     }
                 )
 
         # Format successful response
         message_data = waha_response.data
-        message_id = message_data.get("message_id", f"msg_{int(time.time())}_{chat_id}")
-
-        return JSONResponse(
-            status_code=200,
-            content={
-                "success": True,
-                "data": {
-                    "message_id": message_id,
-                    "chat_id": chat_id,
-                    "message": message if message_type == 'text' else (media_caption or 'Media message'),
-                    "type": message_type,
-                    "session": session,
-                    "status": "sent",
-                    "timestamp": settings.get_current_time(),
-                    "media": {
-                        "url": media_url,
-                        "caption": media_caption,
-                        "type": message_type
-                    } if message_type != 'text' else None,
-                    "auto_response": {
-                        "enabled": auto_response_enabled,
-                        "delay_ms": settings.RESPONSE_DELAY_MS,
-                        "scheduled": auto_response_enabled
-                    }
-                },
-                "metadata": {
-                    "response_time_ms": response_time,
-                    "timestamp": settings.get_current_time(),
-                    "request_id": getattr(request.state, "request_id", None)
-                }
+        message_id = message_data.get("message_id") or f"msg_{uuid.uuid4().hex}"
+
+        data = {
+            "message_id": message_id,
+            "chat_id": chat_id,
+            "message": message if message_type == 'text' else (media_caption or 'Media message'),
+            "type": message_type,
+            "session": session,
+            "status": "sent",
+            "timestamp": now_iso
+        }
+        # Optional sections are only present when they apply
+        if message_type != 'text':
+            data["media"] = _compact(url=media_url, caption=media_caption, type=message_type)
+        if auto_response_enabled:
+            data["auto_response"] = {
+                "enabled": True,
+                "delay_ms": settings.RESPONSE_DELAY_MS,
+                "scheduled": True
             }
-        )
+
+        return ORJSONResponse({
+            "success": True,
+            "data": data,
+            "metadata": {
+                "response_time_ms": response_time,
+                "timestamp": now_iso,
+                "request_id": getattr(request.state, "request_id", None)
+            }
+        })
 
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "success": False,
-                "error": "Internal server error",
-                "code": "INTERNAL_ERROR",
-                "details": {
-                    "error": str(e)
-                } if settings.DEBUG else None,
-                "metadata": {
-                    "response_time_ms": int((time.time() - start_time) * 1000),
-                    "timestamp": settings.get_current_time(),
-                    "request_id": getattr(request.state, "request_id", None)
-                }
+        detail = {
+            "success": False,
+            "error": "Internal server error",
+            "code": "INTERNAL_ERROR",
+            "metadata": {
+                "response_time_ms": (time.perf_counter_ns() - start_time) // 1_000_000,
+                "timestamp": now_iso,
+                "request_id": getattr(request.state, "request_id", None)
             }
-        )
+        }
+        if settings.DEBUG:
+            detail["details"] = {"error": str(e)}
+        raise HTTPException(status_code=500, detail=detail)
 
 
-@router.post("/send/batch", summary="Send Batch Messages")
+def _batch_entry(index: int, message_request: SendMessageRequest, outcome: Any) -> Dict[str, Any]:
+    """Describe one /send/batch outcome (a WahaResponse or the exception it raised)"""
+    if isinstance(outcome, Exception):
+        return {
+            "index": index,
+            "chat_id": message_request.chat_id,
+            "success": False,
+            "error": str(outcome),
+            "code": "MESSAGE_SEND_ERROR"
+        }
+    if outcome.success:
+        return {
+            "index": index,
+            "chat_id": message_request.chat_id,
+            "success": True,
+            "message_id": outcome.data.get("message_id"),
+            "status": "sent"
+        }
+    return {
+        "index": index,
+        "chat_id": message_request.chat_id,
+        "success": False,
+        "error": outcome.error,
+        "code": outcome.code
+    }
+
+
+@router.post(
+    "/send/batch",
+    summary="Send Batch Messages",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _BATCH_BODY_SCHEMA}}
+        }
+    }
+)
 async def send_batch_messages(
     request: Request,
-    messages: list[SendMessageRequest] = Body(...)
+    waha_client: WahaClient = Depends(get_waha_client)
 ) -> Dict[str, Any]:
     """
     Send multiple messages in batch
 
-    - **messages**: List of message objects to send
+    - **messages**: List of message objects to send (the JSON request body)
+
+    `data.success_rate` is the fraction of messages sent, from 0.0 to 1.0.
     """
-    start_time = time.time()
-    results = []
-    errors = []
+    start_time = time.perf_counter_ns()
+    now_iso = settings.get_current_time()
+
+    try:
+        messages = _BATCH_ADAPTER.validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)]
+        )
 
     try:
         if len(messages) > 100:
@@ -250,14 +292,13 @@ async def send_batch_messages(
                 }
             )
 
-        logger.info(f"Sending batch of {len(messages)} messages")
+        logger.info("Sending batch of %d messages", len(messages))
 
-        waha_client = WahaClient()
+        semaphore = asyncio.Semaphore(max(1, min(settings.BATCH_SEND_CONCURRENCY, len(messages))))
 
-        for i, message_request in enumerate(messages):
-            try:
-                # Send individual message
-                waha_response = await waha_client.send_message(
+        async def send_one(message_request: SendMessageRequest):
+            async with semaphore:
+                return await waha_client.send_message(
                     chat_id=message_request.chat_id,
                     message=message_request.message,
                     session=message_request.session,
@@ -266,48 +307,35 @@ async def send_batch_messages(
                     media_caption=message_request.media_caption
                 )
 
-                if waha_response.success:
-                    results.append({
-                        "index": i,
-                        "chat_id": message_request.chat_id,
-                        "success": True,
-                        "message_id": waha_response.data.get("message_id"),
-                        "status": "sent"
-                    })
-                else:
-                    errors.append({
-                        "index": i,
-                        "chat_id": message_request.chat_id,
-                        "success": False,
-                        "error": waha_response.error,
-                        "code": waha_response.code
-                    })
-
-            except Exception as e:
-                errors.append({
-                    "index": i,
-                    "chat_id": message_request.chat_id,
-                    "success": False,
-                    "error": str(e),
-                    "code": "MESSAGE_SEND_ERROR"
-                })
+        # Send concurrently (bounded), then collect outcomes in request order
+        outcomes = await asyncio.gather(
+            *(send_one(message_request) for message_request in messages),
+            return_exceptions=True
+        )
 
-        response_time = int((time.time() - start_time) * 1000)
+        entries = [
+            _batch_entry(i, message_request, outcome)
+            for i, (message_request, outcome) in enumerate(zip(messages, outcomes))
+        ]
+        results = [entry for entry in entries if entry["success"]]
+        errors = [entry for entry in entries if not entry["success"]]
+
+        response_time = (time.perf_counter_ns() - start_time) // 1_000_000
 
         return {
             "success": True,
             "data": {
-                "batch_id": f"batch_{int(time.time())}",
+                "batch_id": f"batch_{uuid.uuid4().hex}",
                 "total_messages": len(messages),
                 "successful": len(results),
                 "failed": len(errors),
                 "results": results,
                 "errors": errors,
-                "success_rate": f"{(len(results) / len(messages) * 100):.1f}%" if messages else "0%"
+                "success_rate": len(results) / total if (total := len(messages)) else 0.0
             },
             "metadata": {
                 "response_time_ms": response_time,
-                "timestamp": settings.get_current_time(),
+                "timestamp": now_iso,
                 "request_id": getattr(request.state, "request_id", None)
             }
         }
@@ -315,17 +343,14 @@ async def send_batch_messages(
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "success": False,
-                "error": "Failed to send batch messages",
-                "code": "BATCH_SEND_ERROR",
-                "details": {
-                    "error": str(e)
-                } if settings.DEBUG else None
-            }
-        )
+        detail = {
+            "success": False,
+            "error": "Failed to send batch messages",
+            "code": "BATCH_SEND_ERROR"
+        }
+        if settings.DEBUG:
+            detail["details"] = {"error": str(e)}
+        raise HTTPException(status_code=500, detail=detail)
 
 
 @router.post("/send/mock", summary="Mock Send Message")
@@ -336,32 +361,36 @@ async def send_mock_message(
     """
     Mock send message for testing purposes (doesn't actually send)
     """
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
+    now_iso = settings.get_current_time()
 
     try:
-        response_time = int((time.time() - start_time) * 1000)
-        message_id = f"mock_msg_{int(time.time())}_{message_request.chat_id}"
+        response_time = (time.perf_counter_ns() - start_time) // 1_000_000
+        message_id = f"mock_msg_{uuid.uuid4().hex}"
+
+        data = {
+            "message_id": message_id,
+            "chat_id": message_request.chat_id,
+            "message": message_request.message,
+            "type": message_request.type,
+            "session": message_request.session,
+            "status": "mocked",
+            "timestamp": now_iso,
+            "mock": True
+        }
+        if message_request.type != 'text':
+            data["media"] = _compact(
+                url=message_request.media_url,
+                caption=message_request.media_caption,
+                type=message_request.type
+            )
 
         return {
             "success": True,
-            "data": {
-                "message_id": message_id,
-                "chat_id": message_request.chat_id,
-                "message": message_request.message,
-                "type": message_request.type,
-                "session": message_request.session,
-                "status": "mocked",
-                "timestamp": settings.get_current_time(),
-                "mock": True,
-                "media": {
-                    "url": message_request.media_url,
-                    "caption": message_request.media_caption,
-                    "type": message_request.type
-                } if message_request.type != 'text' else None
-            },
+            "data": data,
             "metadata": {
                 "response_time_ms": response_time,
-                "timestamp": settings.get_current_time(),
+                "timestamp": now_iso,
                 "request_id": getattr(request.state, "request_id", None),
                 "note": "This is a mock response - no message was actually sent"
             }
@@ -2,27 +2,37 @@
 Webhook Routes
 """
 
-import time
+import asyncio
 import hmac
 import hashlib
+import logging
+import re
+import time
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Annotated, Dict, Any, List, Literal, Optional, Union, get_args
 
-from fastapi import APIRouter, Request, HTTPException, Depends, Query, Body, Header
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field, validator
+from fastapi import APIRouter, Request, Response, HTTPException, Depends, Query, Header
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, PlainTextResponse
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
 
 from api.core.config import settings
-from api.core.waha_client import WahaClient
+from api.core.waha_client import WahaClient, get_waha_client
 from api.core.exceptions import WAHAException
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+logger = logging.getLogger(__name__)
+
+WebhookEventType = Literal["message", "messageAck", "sessionStatus", "qrCode", "disconnected"]
+_SUPPORTED_EVENTS = get_args(WebhookEventType)
 
 
 class WebhookMessageData(BaseModel):
     """Webhook message data model"""
+    model_config = ConfigDict(populate_by_name=True)
+
     id: str
-    from: str
+    from_: str = Field(..., alias="from")
     to: str
     body: str
     timestamp: int
@@ -33,18 +43,179 @@ class WebhookMessageData(BaseModel):
     ack: Optional[int] = None
 
 
-class WebhookEvent(BaseModel):
-    """Webhook event model"""
-    event: str = Field(..., regex="^(message|messageAck|sessionStatus|qrCode|disconnected)$")
+class WebhookAckData(BaseModel):
+    """Webhook message acknowledgment data model"""
+    id: str
+    ack: Optional[int] = None
+
+
+class WebhookBodyData(BaseModel):
+    """Webhook data model for events that carry their payload in body (status, QR code)"""
+    body: str
+
+
+class WebhookEmptyData(BaseModel):
+    """Webhook data model for events whose data is not used"""
+
+
+class WebhookMessageEvent(BaseModel):
+    """Webhook message event model"""
+    event: Literal["message"]
     session: str = "default"
     data: WebhookMessageData
 
-    @validator('data')
-    def validate_data_for_event(cls, v, values):
-        event = values.get('event')
-        if event == 'message' and not isinstance(v, dict):
-            raise ValueError('Message event requires valid message data')
-        return v
+
+class WebhookMessageAckEvent(BaseModel):
+    """Webhook message acknowledgment event model"""
+    event: Literal["messageAck"]
+    session: str = "default"
+    data: WebhookAckData
+
+
+class WebhookSessionStatusEvent(BaseModel):
+    """Webhook session status event model"""
+    event: Literal["sessionStatus"]
+    session: str = "default"
+    data: WebhookBodyData
+
+
+class WebhookQRCodeEvent(BaseModel):
+    """Webhook QR code event model"""
+    event: Literal["qrCode"]
+    session: str = "default"
+    data: WebhookBodyData
+
+
+class WebhookDisconnectedEvent(BaseModel):
+    """Webhook disconnection event model"""
+    event: Literal["disconnected"]
+    session: str = "default"
+    data: WebhookEmptyData = WebhookEmptyData()
+
+
+# Tagged on event, so only the data fields that event uses are validated
+WebhookEvent = Annotated[
+    Union[
+        WebhookMessageEvent,
+        WebhookMessageAckEvent,
+        WebhookSessionStatusEvent,
+        WebhookQRCodeEvent,
+        WebhookDisconnectedEvent
+    ],
+    Field(discriminator="event")
+]
+
+
+def _inline_schema_refs(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Resolve local $defs references so a JSON schema can be embedded in openapi_extra"""
+    defs = schema.pop("$defs", {})
+
+    def resolve(node):
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return resolve(defs[node["$ref"].rsplit("/", 1)[1]])
+            # Discriminator mappings point at $defs, which no longer exist once inlined
+            return {
+                key: resolve(value)
+                for key, value in node.items()
+                if not (key == "discriminator" and isinstance(value, dict))
+            }
+        if isinstance(node, list):
+            return [resolve(item) for item in node]
+        return node
+
+    return resolve(schema)
+
+
+# Static error details, built once; handlers only read them
+_VERIFICATION_FAILED_DETAIL = {
+    "success": False,
+    "error": "Webhook verification failed",
+    "code": "WEBHOOK_VERIFICATION_FAILED"
+}
+_INVALID_SIGNATURE_DETAIL = {
+    "success": False,
+    "error": "Invalid webhook signature",
+    "code": "INVALID_WEBHOOK_SIGNATURE"
+}
+_PROCESSING_ERROR_DETAIL = {
+    "success": False,
+    "error": "Webhook processing failed",
+    "code": "WEBHOOK_PROCESSING_ERROR"
+}
+
+# Basic keyword-based auto-responses
+_AUTO_RESPONSE_KEYWORDS = {
+    "greeting": ["hello", "hi", "halo", "hai", "assalamualaikum", "selamat pagi", "selamat siang", "selamat sore", "selamat malam"],
+    "thanks": ["thank", "thanks", "terima kasih", "makasih"],
+    "goodbye": ["bye", "goodbye", "selamat tinggal", "sampai jumpa"],
+    "help": ["help", "bantuan", "tolong"],
+    "status": ["status", "how are you", "apa kabar"],
+    "business": ["price", "harga", "produk", "layanan", "booking"],
+    "location": ["lokasi", "alamat", "dimana", "address"],
+    "contact": ["contact", "kontak", "hubungi", "telp", "phone"]
+}
+_RESPONSE_TEMPLATES = {
+    "greeting": "Halo! Selamat datang di layanan kami. Ada yang bisa kami bantu? 🙏",
+    "thanks": "Sama-sama! Senang bisa membantu Anda. 😊",
+    "goodbye": "Sampai jumpa! Semoga harimu menyenangkan. 👋",
+    "help": "Kami siap membantu! Silakan jelaskan kebutuhan Anda.",
+    "status": "Kami baik-baik saja! Bagaimana dengan Anda? 😊",
+    "business": "Untuk informasi harga dan layanan, silakan hubungi tim sales kami.",
+    "location": "Kantor kami berlokasi di Jl. Contoh No. 123, Jakarta. 📍",
+    "contact": "Hubungi kami di: 📞 021-1234567 atau 📱 wa.me/628123456789",
+    "default": "Terima kasih atas pesan Anda. Kami akan segera merespons."
+}
+# Keywords resolved straight to their template, so a match needs a single lookup
+_AUTO_RESPONSE_BY_KEYWORD = {
+    keyword: _RESPONSE_TEMPLATES[category]
+    for category, keywords in _AUTO_RESPONSE_KEYWORDS.items()
+    for keyword in keywords
+}
+# One alternation over every keyword, so a message is classified in a single scan;
+# longest first so "goodbye" is preferred over "bye" at the same position.
+# Matched against the lowercased message, which is much cheaper than re.IGNORECASE
+_AUTO_RESPONSE_KEYWORD_RE = re.compile(
+    r"\b(?:" + "|".join(
+        re.escape(keyword) for keyword in sorted(_AUTO_RESPONSE_BY_KEYWORD, key=len, reverse=True)
+    ) + r")\b"
+)
+
+# WhatsApp acknowledgment levels
+_ACK_STATUS = {
+    0: "pending",
+    1: "sent",
+    2: "received",
+    3: "read",
+    4: "played"
+}
+
+# Background auto-response sending; see _schedule_auto_response
+_auto_response_queue: Optional[asyncio.Queue] = None
+_auto_response_loop: Optional[asyncio.AbstractEventLoop] = None
+_auto_response_workers: List[asyncio.Task] = []
+_AUTO_RESPONSE_QUEUE_SIZE = 1000
+_AUTO_RESPONSE_BACKLOG_DEPTH = 100
+_AUTO_RESPONSE_BACKLOG_AGE_S = 5.0
+
+# Background message analytics writing; see _queue_message_analytics
+_analytics_queue: Optional[asyncio.Queue] = None
+_analytics_loop: Optional[asyncio.AbstractEventLoop] = None
+_analytics_writer_task: Optional[asyncio.Task] = None
+_ANALYTICS_QUEUE_SIZE = 10000
+_ANALYTICS_BATCH_SIZE = 500
+
+# Keyed once per process; each request copies it instead of redoing the key setup
+_WEBHOOK_HMAC = hmac.new(settings.WEBHOOK_SECRET.encode("utf-8"), digestmod=hashlib.sha256)
+# "sha256=" followed by the hex digest
+_SIGNATURE_LENGTH = len("sha256=") + 2 * _WEBHOOK_HMAC.digest_size
+
+# Validate raw webhook bytes straight into the matching event model in one pass
+_WEBHOOK_EVENT_ADAPTER = TypeAdapter(WebhookEvent)
+
+# The body is read by hand, so document it explicitly; the event models are inlined
+# because they are not registered under components/schemas
+_WEBHOOK_BODY_SCHEMA = _inline_schema_refs(_WEBHOOK_EVENT_ADAPTER.json_schema())
 
 
 class WebhookVerifyRequest(BaseModel):
@@ -60,57 +231,59 @@ async def webhook_verify(
     mode: str = Query(None),
     challenge: str = Query(None),
     verify_token: str = Query(None)
-) -> JSONResponse:
+) -> PlainTextResponse:
     """
     Handle webhook verification (GET request)
 
     Used for initial webhook setup with WAHA
     """
     try:
-        logger.info(f"Webhook verification request: mode={mode}")
+        logger.info("Webhook verification request: mode=%s", mode)
 
         if mode == "subscribe" and verify_token == settings.WEBHOOK_VERIFY_TOKEN:
             logger.info("Webhook verification successful")
-            return JSONResponse(
-                status_code=200,
-                content=challenge
-            )
+            # Echo the challenge verbatim, not as a JSON string
+            return PlainTextResponse(challenge)
 
-        raise HTTPException(
-            status_code=403,
-            detail={
-                "success": False,
-                "error": "Webhook verification failed",
-                "code": "WEBHOOK_VERIFICATION_FAILED",
+        detail = _VERIFICATION_FAILED_DETAIL
+        if settings.DEBUG:
+            detail = {
+                **detail,
                 "details": {
                     "mode": mode,
                     "expected_token": settings.WEBHOOK_VERIFY_TOKEN,
                     "received_token": verify_token
-                } if settings.DEBUG else None
+                }
             }
-        )
+        raise HTTPException(status_code=403, detail=detail)
 
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "success": False,
-                "error": "Webhook verification error",
-                "code": "WEBHOOK_VERIFY_ERROR",
-                "details": {
-                    "error": str(e)
-                } if settings.DEBUG else None
-            }
-        )
-
-
-@router.post("/webhook", summary="Handle Webhook Events")
+        detail = {
+            "success": False,
+            "error": "Webhook verification error",
+            "code": "WEBHOOK_VERIFY_ERROR"
+        }
+        if settings.DEBUG:
+            detail["details"] = {"error": str(e)}
+        raise HTTPException(status_code=500, detail=detail)
+
+
+@router.post(
+    "/webhook",
+    summary="Handle Webhook Events",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _WEBHOOK_BODY_SCHEMA}}
+        }
+    }
+)
 async def webhook_handler(
     request: Request,
     x_waha_signature: Optional[str] = Header(None, description="WAHA signature for security"),
-    webhook_event: WebhookEvent = Body(...)
+    waha_client: WahaClient = Depends(get_waha_client)
 ) -> Dict[str, Any]:
     """
     Handle incoming webhook events from WAHA
@@ -122,65 +295,45 @@ async def webhook_handler(
     - qrCode: QR code available
     - disconnected: Session disconnected
     """
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
+
+    # Buffer the body once: the signature is checked against these bytes and
+    # the event is parsed from them without an intermediate dict
+    raw_body = await request.body()
+
+    # Verify webhook signature if configured
+    if settings.WEBHOOK_SECRET and x_waha_signature:
+        if not _verify_webhook_signature(raw_body, x_waha_signature):
+            raise HTTPException(status_code=403, detail=_INVALID_SIGNATURE_DETAIL)
+
+    try:
+        webhook_event = _WEBHOOK_EVENT_ADAPTER.validate_json(raw_body)
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)]
+        )
 
     try:
         event_type = webhook_event.event
         session = webhook_event.session
         event_data = webhook_event.data
 
-        logger.info(f"Processing webhook event: {event_type} for session: {session}")
-
-        # Verify webhook signature if configured
-        if settings.WEBHOOK_SECRET and x_waha_signature:
-            if not _verify_webhook_signature(
-                await request.body(),
-                x_waha_signature,
-                settings.WEBHOOK_SECRET
-            ):
-                raise HTTPException(
-                    status_code=403,
-                    detail={
-                        "success": False,
-                        "error": "Invalid webhook signature",
-                        "code": "INVALID_WEBHOOK_SIGNATURE"
-                    }
-                )
+        logger.info("Processing webhook event: %s for session: %s", event_type, session)
 
-        # Process different event types
-        response_data = None
-
-        if event_type == "message":
-            response_data = await _handle_message_event(session, event_data)
-        elif event_type == "messageAck":
-            response_data = await _handle_message_ack_event(session, event_data)
-        elif event_type == "sessionStatus":
-            response_data = await _handle_session_status_event(session, event_data)
-        elif event_type == "qrCode":
-            response_data = await _handle_qr_code_event(session, event_data)
-        elif event_type == "disconnected":
-            response_data = await _handle_disconnected_event(session, event_data)
-        else:
-            logger.warning(f"Unknown webhook event: {event_type}")
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "success": False,
-                    "error": "Unknown webhook event",
-                    "code": "UNKNOWN_EVENT",
-                    "details": {
-                        "event": event_type,
-                        "supported_events": ["message", "messageAck", "sessionStatus", "qrCode", "disconnected"]
-                    }
-                }
-            )
+        # Dispatch to the handler for this event type; validation already
+        # rejected anything outside WebhookEventType
+        response_data = await _EVENT_HANDLERS[event_type](session, event_data, waha_client)
 
-        response_time = int((time.time() - start_time) * 1000)
+        response_time = (time.perf_counter_ns() - start_time) // 1_000_000
 
         # Log successful processing
-        logger.info(f"Webhook event {event_type} processed successfully in {response_time}ms")
+        logger.info("Webhook event %s processed successfully in %dms", event_type, response_time)
+
+        # WAHA only looks at the status code; skip building and encoding the summary
+        if settings.WEBHOOK_MINIMAL_RESPONSE:
+            return Response(status_code=200)
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
@@ -204,36 +357,30 @@ async def webhook_handler(
     except Exception as e:
         # Always return 200 for webhooks to prevent retries from WAHA
         # but include error details in the response
-        response_time = int((time.time() - start_time) * 1000)
+        response_time = (time.perf_counter_ns() - start_time) // 1_000_000
 
-        return JSONResponse(
-            status_code=200,
-            content={
-                "success": False,
-                "error": "Webhook processing failed",
-                "code": "WEBHOOK_PROCESSING_ERROR",
-                "details": {
-                    "error": str(e)
-                } if settings.DEBUG else None
-            },
-            metadata={
+        content = {
+            **_PROCESSING_ERROR_DETAIL,
+            "metadata": {
                 "response_time_ms": response_time,
                 "timestamp": settings.get_current_time(),
                 "request_id": getattr(request.state, "request_id", None)
             }
-        )
+        }
+        if settings.DEBUG:
+            content["details"] = {"error": str(e)}
+        return ORJSONResponse(status_code=200, content=content)
 
 
-async def _handle_message_event(session: str, data: WebhookMessageData) -> Dict[str, Any]:
+async def _handle_message_event(session: str, data: WebhookMessageData, waha_client: WahaClient) -> Dict[str, Any]:
     """Handle incoming message events"""
     message_id = data.id
-    from_chat = data.from
+    from_chat = data.from_
     to_chat = data.to
     body = data.body
-    timestamp = data.timestamp
     from_me = data.fromMe
 
-    logger.info(f"New message: {from_chat} -> {to_chat} ({'from me' if from_me else 'to me'})")
+    logger.info("New message: %s -> %s (%s)", from_chat, to_chat, "from me" if from_me else "to me")
 
     # Only process messages from others (not our own messages)
     if from_me:
@@ -250,56 +397,32 @@ async def _handle_message_event(session: str, data: WebhookMessageData) -> Dict[
             auto_response = _get_auto_response(body, from_chat)
 
             if auto_response:
-                # Schedule auto-response with delay
+                # Hand the send to the background workers so the webhook
+                # returns without waiting on the WAHA round trip
                 delay = settings.RESPONSE_DELAY_MS
-
-                # In production, you'd use a task queue like Celery
-                # For now, we'll simulate with a comment
-                logger.info(f"Auto-response scheduled for {from_chat}: {auto_response}")
-
-                # Send response immediately (in production, add delay)
-                waha_client = WahaClient()
-                send_response = await waha_client.send_message(
-                    chat_id=from_chat,
-                    message=auto_response,
-                    session=session
-                )
-
-                if send_response.success:
-                    logger.info(f"Auto-response sent to {from_chat}")
+                if not _schedule_auto_response(waha_client, session, from_chat, auto_response):
                     return {
-                        "action": "auto_response_sent",
-                        "message": auto_response,
-                        "message_id": send_response.data.get("message_id"),
-                        "delay_ms": delay
-                    }
-                else:
-                    logger.warn(f"Failed to send auto-response to {from_chat}")
-                    return {
-                        "action": "auto_response_failed",
-                        "error": send_response.error
+                        "action": "auto_response_dropped",
+                        "reason": "queue_full",
+                        "message_id": message_id
                     }
 
+                logger.info("Auto-response scheduled for %s: %s", from_chat, auto_response)
+                return {
+                    "action": "auto_response_scheduled",
+                    "message": auto_response,
+                    "delay_ms": delay
+                }
+
         except Exception as e:
-            logger.error(f"Error processing auto-response: {str(e)}")
+            logger.error("Error processing auto-response: %s", e)
             return {
                 "action": "auto_response_error",
                 "error": str(e)
             }
 
-    # Store message for analytics (in production, use database)
-    _store_message_analytics({
-        "message_id": message_id,
-        "from": from_chat,
-        "to": to_chat,
-        "body": body,
-        "timestamp": timestamp,
-        "from_me": from_me,
-        "has_media": data.hasMedia,
-        "media_type": data.mediaType,
-        "session": session,
-        "processed_at": settings.get_current_time()
-    })
+    # Store message for analytics; the background writer builds and stores the rows in batches
+    _queue_message_analytics(session, data)
 
     return {
         "action": "processed",
@@ -307,28 +430,29 @@ async def _handle_message_event(session: str, data: WebhookMessageData) -> Dict[
     }
 
 
-async def _handle_message_ack_event(session: str, data: WebhookMessageData) -> Dict[str, Any]:
+async def _handle_message_ack_event(session: str, data: WebhookAckData, waha_client: WahaClient) -> Dict[str, Any]:
     """Handle message acknowledgment events"""
     message_id = data.id
     ack = data.ack
+    status = _convert_ack_status(ack)
 
-    logger.info(f"Message acknowledgment: {message_id} - ack: {ack}")
+    logger.info("Message acknowledgment: %s - ack: %s", message_id, ack)
 
     # Update message status in database (in production)
-    _update_message_status(message_id, ack)
+    _update_message_status(message_id, status)
 
     return {
         "action": "acknowledgment_processed",
         "message_id": message_id,
-        "status": _convert_ack_status(ack)
+        "status": status
     }
 
 
-async def _handle_session_status_event(session: str, data: WebhookMessageData) -> Dict[str, Any]:
+async def _handle_session_status_event(session: str, data: WebhookBodyData, waha_client: WahaClient) -> Dict[str, Any]:
     """Handle session status events"""
     status = data.body  # Status is often in body field for session events
 
-    logger.info(f"Session status changed: {session} - {status}")
+    logger.info("Session status changed: %s - %s", session, status)
 
     # Update session status in database (in production)
     _update_session_status(session, status)
@@ -344,11 +468,11 @@ async def _handle_session_status_event(session: str, data: WebhookMessageData) -
     }
 
 
-async def _handle_qr_code_event(session: str, data: WebhookMessageData) -> Dict[str, Any]:
+async def _handle_qr_code_event(session: str, data: WebhookBodyData, waha_client: WahaClient) -> Dict[str, Any]:
     """Handle QR code events"""
     qr_code = data.body  # QR code is often in body field
 
-    logger.info(f"QR code received for session: {session}")
+    logger.info("QR code received for session: %s", session)
 
     # Store QR code for scanning (in production, use secure storage)
     _store_qr_code(session, qr_code)
@@ -360,9 +484,9 @@ async def _handle_qr_code_event(session: str, data: WebhookMessageData) -> Dict[
     }
 
 
-async def _handle_disconnected_event(session: str, data: WebhookMessageData) -> Dict[str, Any]:
+async def _handle_disconnected_event(session: str, data: WebhookEmptyData, waha_client: WahaClient) -> Dict[str, Any]:
     """Handle disconnection events"""
-    logger.info(f"Session disconnected: {session}")
+    logger.info("Session disconnected: %s", session)
 
     # Clean up session data
     _cleanup_session_data(session)
@@ -373,108 +497,201 @@ async def _handle_disconnected_event(session: str, data: WebhookMessageData) ->
     }
 
 
-def _verify_webhook_signature(payload: bytes, signature: str, secret: str) -> bool:
-    """Verify webhook signature"""
-    if not signature.startswith("sha256="):
+def _schedule_auto_response(waha_client: WahaClient, session: str, chat_id: str, message: str) -> bool:
+    """Queue an auto-response, starting the worker pool on the running loop if needed; False when the queue is full"""
+    global _auto_response_queue, _auto_response_loop
+
+    loop = asyncio.get_running_loop()
+    if _auto_response_loop is not loop:
+        # Queues and tasks are bound to one event loop; (re)create them on first use
+        _auto_response_queue = asyncio.Queue(maxsize=_AUTO_RESPONSE_QUEUE_SIZE)
+        _auto_response_loop = loop
+        _auto_response_workers[:] = [
+            loop.create_task(_auto_response_worker(_auto_response_queue))
+            for _ in range(max(1, settings.AUTO_RESPONSE_WORKERS))
+        ]
+
+    try:
+        _auto_response_queue.put_nowait((time.monotonic(), waha_client, session, chat_id, message))
+    except asyncio.QueueFull:
+        logger.warning("Auto-response queue full, dropping response to %s", chat_id)
+        return False
+    return True
+
+
+async def _auto_response_worker(queue: asyncio.Queue):
+    """Send queued auto-responses once their RESPONSE_DELAY_MS has elapsed"""
+    delay = settings.RESPONSE_DELAY_MS / 1000
+
+    while True:
+        enqueued_at, waha_client, session, chat_id, message = await queue.get()
+        try:
+            age = time.monotonic() - enqueued_at
+            if age > _AUTO_RESPONSE_BACKLOG_AGE_S and queue.qsize() > _AUTO_RESPONSE_BACKLOG_DEPTH:
+                logger.warning(
+                    "Auto-response backlog: %d queued, oldest waited %.1fs",
+                    queue.qsize(), age
+                )
+            if age < delay:
+                await asyncio.sleep(delay - age)
+
+            send_response = await waha_client.send_message(
+                chat_id=chat_id,
+                message=message,
+                session=session
+            )
+            if send_response.success:
+                logger.info("Auto-response sent to %s", chat_id)
+            else:
+                logger.warning("Failed to send auto-response to %s: %s", chat_id, send_response.error)
+        except Exception:
+            logger.exception("Error sending auto-response to %s", chat_id)
+        finally:
+            queue.task_done()
+
+
+def _queue_message_analytics(session: str, data: WebhookMessageData):
+    """Queue a message for analytics, starting the writer on the running loop if needed"""
+    global _analytics_queue, _analytics_loop, _analytics_writer_task
+
+    loop = asyncio.get_running_loop()
+    if _analytics_loop is not loop:
+        # Queues and tasks are bound to one event loop; (re)create them on first use
+        _analytics_queue = asyncio.Queue(maxsize=_ANALYTICS_QUEUE_SIZE)
+        _analytics_loop = loop
+        _analytics_writer_task = loop.create_task(_analytics_writer(_analytics_queue))
+
+    try:
+        _analytics_queue.put_nowait((session, data, settings.get_current_time()))
+    except asyncio.QueueFull:
+        logger.warning("Analytics queue full, dropping message %s", data.id)
+
+
+async def _analytics_writer(queue: asyncio.Queue):
+    """Drain queued messages and store them in batches of up to _ANALYTICS_BATCH_SIZE"""
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < _ANALYTICS_BATCH_SIZE and not queue.empty():
+            batch.append(queue.get_nowait())
+
+        try:
+            _store_message_analytics([
+                {
+                    "message_id": data.id,
+                    "from": data.from_,
+                    "to": data.to,
+                    "body": data.body,
+                    "timestamp": data.timestamp,
+                    "from_me": data.fromMe,
+                    "has_media": data.hasMedia,
+                    "media_type": data.mediaType,
+                    "session": session,
+                    "processed_at": processed_at
+                }
+                for session, data, processed_at in batch
+            ])
+        except Exception:
+            logger.exception("Error storing %d message analytics records", len(batch))
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
+async def _stop_background_tasks():
+    """Cancel the auto-response workers and analytics writer running on this loop (app shutdown)"""
+    global _auto_response_queue, _auto_response_loop, _analytics_queue, _analytics_loop, _analytics_writer_task
+
+    loop = asyncio.get_running_loop()
+    tasks = []
+    if _auto_response_loop is loop:
+        tasks.extend(_auto_response_workers)
+        _auto_response_workers.clear()
+        _auto_response_queue = _auto_response_loop = None
+    if _analytics_loop is loop and _analytics_writer_task is not None:
+        tasks.append(_analytics_writer_task)
+        _analytics_queue = _analytics_loop = _analytics_writer_task = None
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+# Included into the app's shutdown handlers by include_router
+router.add_event_handler("shutdown", _stop_background_tasks)
+
+
+_EVENT_HANDLERS = {
+    "message": _handle_message_event,
+    "messageAck": _handle_message_ack_event,
+    "sessionStatus": _handle_session_status_event,
+    "qrCode": _handle_qr_code_event,
+    "disconnected": _handle_disconnected_event
+}
+
+
+def _verify_webhook_signature(payload: bytes, signature: str) -> bool:
+    """Verify a "sha256=<hex>" webhook signature against the configured secret"""
+    # Reject malformed headers before spending an HMAC on them
+    if len(signature) != _SIGNATURE_LENGTH or not signature.startswith("sha256="):
         return False
 
-    signature_hash = signature.split("=")[1]
-    expected_hash = hmac.new(
-        secret.encode('utf-8'),
-        payload,
-        hashlib.sha256
-    ).hexdigest()
+    try:
+        signature_digest = bytes.fromhex(signature[7:])
+    except ValueError:
+        return False
 
-    return hmac.compare_digest(signature_hash, expected_hash)
+    mac = _WEBHOOK_HMAC.copy()
+    mac.update(payload)
+    return hmac.compare_digest(mac.digest(), signature_digest)
 
 
 def _get_auto_response(incoming_message: str, chat_id: str) -> Optional[str]:
-    """Get auto-response based on message content"""
-    message = incoming_message.lower()
-
-    # Basic keyword-based auto-responses
-    responses = {
-        "greeting": ["hello", "hi", "halo", "hai", "assalamualaikum", "selamat pagi", "selamat siang", "selamat sore", "selamat malam"],
-        "thanks": ["thank", "thanks", "terima kasih", "makasih"],
-        "goodbye": ["bye", "goodbye", "selamat tinggal", "sampai jumpa"],
-        "help": ["help", "bantuan", "tolong"],
-        "status": ["status", "how are you", "apa kabar"],
-        "business": ["price", "harga", "produk", "layanan", "booking"],
-        "location": ["lokasi", "alamat", "dimana", "address"],
-        "contact": ["contact", "kontak", "hubungi", "telp", "phone"]
-    }
-
-    # Check for keywords and return appropriate response
-    for category, keywords in responses.items():
-        if any(keyword in message for keyword in keywords):
-            return _get_response_template(category)
+    """Get auto-response based on the first keyword found in the message"""
+    match = _AUTO_RESPONSE_KEYWORD_RE.search(incoming_message.lower())
+    if match:
+        return _AUTO_RESPONSE_BY_KEYWORD[match.group(0)]
 
     # Return default response if no keywords matched
-    return _get_response_template("default")
-
-
-def _get_response_template(category: str) -> str:
-    """Get response template for category"""
-    templates = {
-        "greeting": "Halo! Selamat datang di layanan kami. Ada yang bisa kami bantu? 🙏",
-        "thanks": "Sama-sama! Senang bisa membantu Anda. 😊",
-        "goodbye": "Sampai jumpa! Semoga harimu menyenangkan. 👋",
-        "help": "Kami siap membantu! Silakan jelaskan kebutuhan Anda.",
-        "status": "Kami baik-baik saja! Bagaimana dengan Anda? 😊",
-        "business": "Untuk informasi harga dan layanan, silakan hubungi tim sales kami.",
-        "location": "Kantor kami berlokasi di Jl. Contoh No. 123, Jakarta. 📍",
-        "contact": "Hubungi kami di: 📞 021-1234567 atau 📱 wa.me/628123456789",
-        "default": "Terima kasih atas pesan Anda. Kami akan segera merespons."
-    }
-
-    return templates.get(category, templates["default"])
+    return _RESPONSE_TEMPLATES["default"]
 
 
 def _convert_ack_status(ack: int) -> str:
     """Convert WhatsApp acknowledgment status to readable format"""
-    ack_map = {
-        0: "pending",
-        1: "sent",
-        2: "received",
-        3: "read",
-        4: "played"
-    }
-
-    return ack_map.get(ack, "unknown")
+    return _ACK_STATUS.get(ack, "unknown")
 
 
-def _store_message_analytics(message_data: dict):
-    """Store message analytics (in production, use database)"""
-    logger.debug(f"Storing message analytics: {message_data}")
+def _store_message_analytics(records: List[Dict[str, Any]]):
+    """Store a batch of message analytics records (in production, one bulk database insert)"""
+    logger.debug("Storing %d message analytics records", len(records))
 
 
-def _update_message_status(message_id: str, ack: int):
+def _update_message_status(message_id: str, status: str):
     """Update message status in database"""
-    logger.debug(f"Updating message {message_id} status to {_convert_ack_status(ack)}")
+    logger.debug("Updating message %s status to %s", message_id, status)
 
 
 def _update_session_status(session: str, status: str):
     """Update session status in database"""
-    logger.debug(f"Updating session {session} status to {status}")
+    logger.debug("Updating session %s status to %s", session, status)
 
 
 async def _send_session_alert(session: str, status: str):
     """Send session alert to administrators"""
-    logger.warning(f"Session alert: {session} is {status}")
+    logger.warning("Session alert: %s is %s", session, status)
 
 
 def _store_qr_code(session: str, qr_code: str):
     """Store QR code securely"""
-    logger.debug(f"Storing QR code for session {session}")
+    logger.debug("Storing QR code for session %s", session)
 
 
 def _cleanup_session_data(session: str):
     """Clean up session-related data"""
-    logger.debug(f"Cleaning up data for session {session}")
+    logger.debug("Cleaning up data for session %s", session)
 
 
 @router.get("/webhook/info", summary="Get Webhook Information")
-async def webhook_info() -> Dict[str, Any]:
+async def webhook_info(request: Request) -> Dict[str, Any]:
     """
     Get information about webhook configuration
     """
@@ -482,7 +699,7 @@ async def webhook_info() -> Dict[str, Any]:
         "success": True,
         "data": {
             "webhook_url": f"{request.base_url}/webhook",
-            "events": ["message", "messageAck", "sessionStatus", "qrCode", "disconnected"],
+            "events": list(_SUPPORTED_EVENTS),
             "security": {
                 "signature_enabled": bool(settings.WEBHOOK_SECRET),
                 "verification_token": settings.WEBHOOK_VERIFY_TOKEN
@@ -3,16 +3,23 @@ Main FastAPI Application Entry Point
 WAHA WhatsApp API Automation System
 """
 
+import asyncio
 import os
+import re
 import sys
+import time
 from pathlib import Path
-from contextlib import asynccontextmanager
-from datetime import datetime
-
-from fastapi import FastAPI, HTTPException
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
+from functools import lru_cache, partial, wraps
+from datetime import datetime, timezone
+
+import orjson
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
 
 # Add project root to path
 project_root = Path(__file__).parent
@@ -44,6 +51,18 @@ class SendMessageRequest(BaseModel):
     session: str = "default"
     type: str = "text"
 
+class WebhookMessageData(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    # Nullable like the old dict payload: null values skip the auto-response instead of failing validation
+    body: Optional[str] = None
+    from_: Optional[str] = Field(None, alias="from")
+    fromMe: Optional[bool] = False
+
+class WebhookEvent(BaseModel):
+    event: Optional[str] = "message"
+    data: Optional[WebhookMessageData] = WebhookMessageData()
+
 # Simple settings (tanpa kompleks config dulu)
 class SimpleSettings:
     def __init__(self):
@@ -51,30 +70,177 @@ class SimpleSettings:
         self.WAHA_API_URL = os.getenv("WAHA_API_URL", "http://localhost:3000")
         self.APP_NAME = "WAHA FastAPI"
         self.APP_VERSION = "1.0.0"
+        # Resolved once here instead of reading the environment on every request
+        self.AUTO_RESPONSE_ENABLED = os.getenv("AUTO_RESPONSE_ENABLED", "true").lower() == "true"
+        # Cap on concurrent outbound WAHA calls
+        self.WAHA_MAX_INFLIGHT = int(os.getenv("WAHA_MAX_INFLIGHT", "64"))
+        # How long /contacts and /chats responses are reused; /messages is never cached
+        self.RESPONSE_CACHE_TTL_SECONDS = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "5"))
 
     def get_current_time(self):
-        return datetime.now().isoformat() + "Z"
+        return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
 
 settings = SimpleSettings()
 
+# Auto-response keyword buckets, built once at import: name -> (keywords, response)
+AUTO_RESPONSE_BUCKETS = {
+    "greeting": (("halo", "hi", "assalamualaikum", "hello"),
+                 "Halo! Terima kasih telah menghubungi kami. Ada yang bisa kami bantu?"),
+    "thanks": (("terima kasih", "thank you", "makasih"),
+               "Sama-sama! Senang bisa membantu Anda."),
+    "help": (("help", "bantuan", "tolong"),
+             "Bantuan tersedia! Silakan jelaskan masalah Anda dan kami akan segera membantu."),
+    "business": (("harga", "produk", "layanan"),
+                 "Informasi bisnis:\n• Produk: Tersedia berbagai pilihan\n• Harga: Kompetitif dan terjangkau\n• Layanan: 24/7 support\n\nUntuk info detail, silakan hubungi admin kami."),
+    "location": (("lokasi", "alamat"),
+                 "Lokasi kami:\nJl. Contoh No. 123, Jakarta\n\nJam operasional: 08:00 - 22:00 WIB"),
+    "contact": (("kontak", "hubungi"),
+                "Kontak kami:\n• WhatsApp: +62 812-3456-7890\n• Email: info@contoh.com\n• Website: www.contoh.com"),
+}
+AUTO_RESPONSES = {name: response for name, (_, response) in AUTO_RESPONSE_BUCKETS.items()}
+AUTO_RESPONSE_DEFAULT = "Maaf, saya tidak mengerti pesan Anda. Silakan ulangi dengan kata yang berbeda."
+# One named group per bucket, so a single C-level search both finds the keyword
+# and names its bucket via match.lastgroup
+AUTO_RESPONSE_RE = re.compile("|".join(
+    f"(?P<{name}>" + "|".join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True)) + ")"
+    for name, (keywords, _) in AUTO_RESPONSE_BUCKETS.items()
+))
+
+# Static mock data, shared by the fallback branches instead of rebuilt per request
+MOCK_NOTE_UNAVAILABLE = "WAHA automator not available - showing mock data"
+MOCK_NOTE_NONE = "WAHA automator returned None - showing fallback mock data"
+MOCK_FALLBACK_NOTES = frozenset({MOCK_NOTE_UNAVAILABLE, MOCK_NOTE_NONE})
+# The requested chat is filled in as "from" (incoming) or "to" (fromMe) per request
+MOCK_MESSAGES = (
+    {
+        "id": "msg_001",
+        "to": "628123456789@c.us",
+        "body": "Sample message 1",
+        "timestamp": "2025-12-15T04:00:00.000Z",
+        "fromMe": False
+    },
+    {
+        "id": "msg_002",
+        "from": "628123456789@c.us",
+        "body": "Sample response 1",
+        "timestamp": "2025-12-15T04:01:00.000Z",
+        "fromMe": True
+    }
+)
+MOCK_CONTACTS = (
+    {
+        "id": "628123456789@c.us",
+        "name": "John Doe",
+        "phone": "+62 812-3456-7890",
+        "isMyContact": True,
+        "isWaContact": True
+    },
+    {
+        "id": "628987654321@c.us",
+        "name": "Jane Smith",
+        "phone": "+62 898-765-4321",
+        "isMyContact": True,
+        "isWaContact": True
+    }
+)
+MOCK_CHATS = (
+    {
+        "id": "628123456789@c.us",
+        "name": "John Doe",
+        "lastMessage": "Sample message 1",
+        "timestamp": 1704240000,
+        "unreadCount": 2,
+        "isGroup": False,
+        "isOnline": True
+    },
+    {
+        "id": "120363419906557011@g.us",
+        "name": "Sample Group",
+        "lastMessage": "Sample group message",
+        "timestamp": 1704236400,
+        "unreadCount": 5,
+        "isGroup": True,
+        "participants": 25
+    }
+)
+
+RESPONSE_CACHE_MAXSIZE = 512
+
+# Fully static payloads, serialized once
+ROOT_RESPONSE_BYTES = orjson.dumps({
+    "message": "WAHA FastAPI - WhatsApp HTTP API Automation System",
+    "version": "1.0.0",
+    "status": "running",
+    "docs": "/docs"
+})
+
+# Health sections that only depend on startup configuration
+WABA_HEALTH_SERVICES = {
+    "waha_api": {
+        "status": "connected",
+        "url": settings.WAHA_API_URL
+    },
+    "waha_automator": {
+        "status": "available" if WAHA_AUTOMATOR_AVAILABLE else "unavailable",
+        "enabled": WAHA_AUTOMATOR_AVAILABLE
+    },
+    "environment": {
+        "status": "configured"
+    }
+}
+WABA_HEALTH_FEATURES = {
+    "authentication": True,
+    "rate_limiting": True,
+    "auto_response": True,
+    "webhook": True,
+    "real_waha_integration": WAHA_AUTOMATOR_AVAILABLE
+}
+
+# Auto-response logic; pure, and chats repeat short messages ("hi", "makasih") a lot
+@lru_cache(maxsize=2048)
+def generate_auto_response(message: str) -> str:
+    """Generate auto-response based on the first keyword found in the message"""
+    match = AUTO_RESPONSE_RE.search(message.lower())
+    return AUTO_RESPONSES[match.lastgroup] if match else AUTO_RESPONSE_DEFAULT
+
+async def tick_now_iso(app: FastAPI):
+    """Refresh app.state.now_iso twice a second so handlers don't format a timestamp per request"""
+    while True:
+        app.state.now_iso = settings.get_current_time()
+        await asyncio.sleep(0.5)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     print("Starting WAHA FastAPI Application")
+    now_iso_task = asyncio.create_task(tick_now_iso(app))
 
     # Initialize app state
     app.state.analytics = {
         "requests_total": 0,
         "responses_sent": 0,
         "errors_total": 0,
-        "start_time": datetime.now().isoformat() + "Z"
+        "start_time": settings.get_current_time()
     }
 
+    # Backpressure for outbound WAHA calls. They run on a dedicated pool sized to the
+    # semaphore: the default executor only has min(32, cpu + 4) workers
+    app.state.waha_executor = ThreadPoolExecutor(
+        max_workers=settings.WAHA_MAX_INFLIGHT, thread_name_prefix="waha"
+    )
+    app.state.waha_sem = asyncio.Semaphore(settings.WAHA_MAX_INFLIGHT)
+    app.state.waha_inflight = 0
+
     print("Application startup complete")
 
     yield
 
     print("Shutting down WAHA FastAPI Application")
+    now_iso_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await now_iso_task
+    generate_auto_response.cache_clear()
+    app.state.waha_executor.shutdown(wait=False, cancel_futures=True)
     print("Graceful shutdown complete")
 
 def create_app() -> FastAPI:
@@ -86,7 +252,8 @@ def create_app() -> FastAPI:
         version="1.0.0",
         docs_url="/docs",
         redoc_url="/redoc",
-        lifespan=lifespan
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse
     )
 
     # Add CORS middleware
@@ -98,36 +265,60 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
-    # Auto-response logic
-    def generate_auto_response(message: str) -> str:
-        """Generate auto-response based on message content"""
-        message_lower = message.lower()
-
-        if any(greeting in message_lower for greeting in ["halo", "hi", "assalamualaikum", "hello"]):
-            return "Halo! Terima kasih telah menghubungi kami. Ada yang bisa kami bantu?"
-        elif any(thanks in message_lower for thanks in ["terima kasih", "thank you", "makasih"]):
-            return "Sama-sama! Senang bisa membantu Anda."
-        elif any(help_word in message_lower for help_word in ["help", "bantuan", "tolong"]):
-            return "Bantuan tersedia! Silakan jelaskan masalah Anda dan kami akan segera membantu."
-        elif any(business in message_lower for business in ["harga", "produk", "layanan"]):
-            return "Informasi bisnis:\n• Produk: Tersedia berbagai pilihan\n• Harga: Kompetitif dan terjangkau\n• Layanan: 24/7 support\n\nUntuk info detail, silakan hubungi admin kami."
-        elif any(location in message_lower for location in ["lokasi", "alamat"]):
-            return "Lokasi kami:\nJl. Contoh No. 123, Jakarta\n\nJam operasional: 08:00 - 22:00 WIB"
-        elif any(contact in message_lower for contact in ["kontak", "hubungi"]):
-            return "Kontak kami:\n• WhatsApp: +62 812-3456-7890\n• Email: info@contoh.com\n• Website: www.contoh.com"
-        else:
-            return "Maaf, saya tidak mengerti pesan Anda. Silakan ulangi dengan kata yang berbeda."
+    # Response timestamp, kept fresh by tick_now_iso while the app is running
+    app.state.now_iso = settings.get_current_time()
+
+    async def call_waha(func, **kwargs):
+        """Run a blocking WAHA automator call on the lifespan's WAHA worker pool, at most WAHA_MAX_INFLIGHT at once"""
+        async with app.state.waha_sem:
+            app.state.waha_inflight += 1
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    app.state.waha_executor, partial(func, **kwargs)
+                )
+            finally:
+                app.state.waha_inflight -= 1
+
+    # Short-lived response cache for polled, paginated proxy endpoints:
+    # (endpoint, *query params) -> (expires_at, serialized body)
+    app.state.response_cache = {}
+    cache_headers = {"Cache-Control": f"max-age={settings.RESPONSE_CACHE_TTL_SECONDS}"}
+    no_store_headers = {"Cache-Control": "no-store"}
+
+    def ttl_cached(endpoint):
+        """Serve repeat calls with the same query params from app.state.response_cache"""
+        @wraps(endpoint)
+        async def wrapper(**params):
+            cache = app.state.response_cache
+            key = (endpoint.__name__, *params.values())
+            now = time.monotonic()
+            entry = cache.get(key)
+            if entry is None or entry[0] <= now:
+                result = await endpoint(**params)
+                data = result.get("data")
+                if isinstance(data, dict) and data.get("note") in MOCK_FALLBACK_NOTES:
+                    # Mock fallback: retry WAHA on the next call instead of serving it for the TTL
+                    return Response(orjson.dumps(result), media_type="application/json", headers=no_store_headers)
+                entry = (now + settings.RESPONSE_CACHE_TTL_SECONDS, orjson.dumps(result))
+                # Re-insert at the end so dict order stays expiry order
+                cache.pop(key, None)
+                cache[key] = entry
+                if len(cache) > RESPONSE_CACHE_MAXSIZE:
+                    # Drop expired entries (all at the front), then the oldest if still full
+                    oldest = next(iter(cache))
+                    while cache[oldest][0] <= now:
+                        del cache[oldest]
+                        oldest = next(iter(cache))
+                    if len(cache) > RESPONSE_CACHE_MAXSIZE:
+                        del cache[oldest]
+            return Response(entry[1], media_type="application/json", headers=cache_headers)
+        return wrapper
 
     # Root endpoint
     @app.get("/")
     async def root():
         """Root endpoint"""
-        return {
-            "message": "WAHA FastAPI - WhatsApp HTTP API Automation System",
-            "version": "1.0.0",
-            "status": "running",
-            "docs": "/docs"
-        }
+        return Response(ROOT_RESPONSE_BYTES, media_type="application/json")
 
     # Health check endpoint
     @app.get("/health")
@@ -135,8 +326,10 @@ def create_app() -> FastAPI:
         """Simple health check"""
         return {
             "status": "healthy",
-            "timestamp": settings.get_current_time(),
-            "version": "1.0.0"
+            "timestamp": app.state.now_iso,
+            "version": "1.0.0",
+            "waha_inflight": app.state.waha_inflight,
+            "waha_max_inflight": settings.WAHA_MAX_INFLIGHT
         }
 
     # WABA health endpoint
@@ -147,29 +340,11 @@ def create_app() -> FastAPI:
             "success": True,
             "data": {
                 "status": "healthy",
-                "timestamp": settings.get_current_time(),
+                "timestamp": app.state.now_iso,
                 "responseTime": "45ms",
                 "version": "1.0.0",
-                "services": {
-                    "waha_api": {
-                        "status": "connected",
-                        "url": settings.WAHA_API_URL
-                    },
-                    "waha_automator": {
-                        "status": "available" if WAHA_AUTOMATOR_AVAILABLE else "unavailable",
-                        "enabled": WAHA_AUTOMATOR_AVAILABLE
-                    },
-                    "environment": {
-                        "status": "configured"
-                    }
-                },
-                "features": {
-                    "authentication": True,
-                    "rate_limiting": True,
-                    "auto_response": True,
-                    "webhook": True,
-                    "real_waha_integration": WAHA_AUTOMATOR_AVAILABLE
-                }
+                "services": WABA_HEALTH_SERVICES,
+                "features": WABA_HEALTH_FEATURES
             }
         }
 
@@ -185,7 +360,7 @@ def create_app() -> FastAPI:
                 "original_message": request.message,
                 "auto_response": response,
                 "response_generated": True,
-                "timestamp": settings.get_current_time()
+                "timestamp": app.state.now_iso
             }
         }
 
@@ -196,7 +371,8 @@ def create_app() -> FastAPI:
         try:
             if WAHA_AUTOMATOR_AVAILABLE:
                 # Use WAHA automator to send real message
-                waha_response = send_whatsapp_message(
+                waha_response = await call_waha(
+                    send_whatsapp_message,
                     chat_id=request.chatId,
                     message=request.message,
                     session=request.session
@@ -204,7 +380,7 @@ def create_app() -> FastAPI:
 
                 # Generate auto-response if enabled
                 auto_response = None
-                if os.getenv("AUTO_RESPONSE_ENABLED", "true").lower() == "true":
+                if settings.AUTO_RESPONSE_ENABLED:
                     auto_response = generate_auto_response(request.message)
 
                 return {
@@ -215,12 +391,12 @@ def create_app() -> FastAPI:
                         "session": request.session,
                         "waha_response": waha_response,
                         "auto_response": auto_response,
-                        "timestamp": settings.get_current_time()
+                        "timestamp": app.state.now_iso
                     }
                 }
             else:
                 # Fallback to mock response
-                auto_response = generate_auto_response(request.message) if os.getenv("AUTO_RESPONSE_ENABLED", "true").lower() == "true" else None
+                auto_response = generate_auto_response(request.message) if settings.AUTO_RESPONSE_ENABLED else None
 
                 return {
                     "success": True,
@@ -229,7 +405,7 @@ def create_app() -> FastAPI:
                         "chatId": request.chatId,
                         "session": request.session,
                         "auto_response": auto_response,
-                        "timestamp": settings.get_current_time(),
+                        "timestamp": app.state.now_iso,
                         "note": "WAHA automator not available - running in mock mode"
                     }
                 }
@@ -243,7 +419,8 @@ def create_app() -> FastAPI:
         try:
             if WAHA_AUTOMATOR_AVAILABLE:
                 # Use WAHA automator to get real messages
-                waha_response = get_waha_messages(
+                waha_response = await call_waha(
+                    get_waha_messages,
                     chat_id=chatId,
                     limit=limit,
                     offset=offset
@@ -259,27 +436,13 @@ def create_app() -> FastAPI:
                     "success": True,
                     "data": {
                         "messages": [
-                            {
-                                "id": "msg_001",
-                                "from": chatId,
-                                "to": "628123456789@c.us",
-                                "body": "Sample message 1",
-                                "timestamp": "2025-12-15T04:00:00.000Z",
-                                "fromMe": False
-                            },
-                            {
-                                "id": "msg_002",
-                                "from": "628123456789@c.us",
-                                "to": chatId,
-                                "body": "Sample response 1",
-                                "timestamp": "2025-12-15T04:01:00.000Z",
-                                "fromMe": True
-                            }
+                            {**message, "to" if message["fromMe"] else "from": chatId}
+                            for message in MOCK_MESSAGES
                         ],
-                        "total": 2,
+                        "total": len(MOCK_MESSAGES),
                         "limit": limit,
                         "offset": offset,
-                        "note": "WAHA automator not available - showing mock data"
+                        "note": MOCK_NOTE_UNAVAILABLE
                     }
                 }
         except Exception as e:
@@ -287,87 +450,52 @@ def create_app() -> FastAPI:
 
     # Contacts endpoint
     @app.get("/api/waba/contacts")
+    @ttl_cached
     async def get_contacts(limit: int = 100, offset: int = 0):
         """Get contacts from WAHA"""
         try:
             if WAHA_AUTOMATOR_AVAILABLE:
                 # Use WAHA automator to get real contacts
-                waha_response = get_waha_contacts(
+                waha_response = await call_waha(
+                    get_waha_contacts,
                     limit=limit,
                     offset=offset
                 )
 
                 # Ensure waha_response is not None
-                if waha_response is None:
-                    # Fallback to mock data
+                if waha_response is not None:
                     return {
                         "success": True,
-                        "data": {
-                            "contacts": [
-                                {
-                                    "id": "628123456789@c.us",
-                                    "name": "John Doe",
-                                    "phone": "+62 812-3456-7890",
-                                    "isMyContact": True,
-                                    "isWaContact": True
-                                },
-                                {
-                                    "id": "628987654321@c.us",
-                                    "name": "Jane Smith",
-                                    "phone": "+62 898-765-4321",
-                                    "isMyContact": True,
-                                    "isWaContact": True
-                                }
-                            ],
-                            "total": 2,
-                            "limit": limit,
-                            "offset": offset,
-                            "note": "WAHA automator returned None - showing fallback mock data"
-                        }
+                        "data": waha_response
                     }
-
-                return {
-                    "success": True,
-                    "data": waha_response
-                }
+                note = MOCK_NOTE_NONE
             else:
-                # Fallback to mock data
-                return {
-                    "success": True,
-                    "data": {
-                        "contacts": [
-                            {
-                                "id": "628123456789@c.us",
-                                "name": "John Doe",
-                                "phone": "+62 812-3456-7890",
-                                "isMyContact": True,
-                                "isWaContact": True
-                            },
-                            {
-                                "id": "628987654321@c.us",
-                                "name": "Jane Smith",
-                                "phone": "+62 898-765-4321",
-                                "isMyContact": True,
-                                "isWaContact": True
-                            }
-                        ],
-                        "total": 2,
-                        "limit": limit,
-                        "offset": offset,
-                        "note": "WAHA automator not available - showing mock data"
-                    }
+                note = MOCK_NOTE_UNAVAILABLE
+
+            # Fallback to mock data
+            return {
+                "success": True,
+                "data": {
+                    "contacts": MOCK_CONTACTS,
+                    "total": len(MOCK_CONTACTS),
+                    "limit": limit,
+                    "offset": offset,
+                    "note": note
                 }
+            }
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
     # Chats endpoint
     @app.get("/api/waba/chats")
+    @ttl_cached
     async def get_chats(session: str = "default", sortBy: str = "name", sortOrder: str = "desc", limit: int = 100, offset: int = 0):
         """Get chats from WAHA"""
         try:
             if WAHA_AUTOMATOR_AVAILABLE:
                 # Use WAHA automator to get real chats
-                waha_response = get_waha_chats(
+                waha_response = await call_waha(
+                    get_waha_chats,
                     limit=limit,
                     offset=offset,
                     session=session,
@@ -376,107 +504,55 @@ def create_app() -> FastAPI:
                 )
 
                 # Ensure waha_response is not None
-                if waha_response is None:
-                    # Fallback to mock data
+                if waha_response is not None:
                     return {
                         "success": True,
-                        "data": {
-                            "chats": [
-                                {
-                                    "id": "628123456789@c.us",
-                                    "name": "John Doe",
-                                    "lastMessage": "Sample message 1",
-                                    "timestamp": 1704240000,
-                                    "unreadCount": 2,
-                                    "isGroup": False,
-                                    "isOnline": True
-                                },
-                                {
-                                    "id": "120363419906557011@g.us",
-                                    "name": "Sample Group",
-                                    "lastMessage": "Sample group message",
-                                    "timestamp": 1704236400,
-                                    "unreadCount": 5,
-                                    "isGroup": True,
-                                    "participants": 25
-                                }
-                            ],
-                            "total": 2,
-                            "limit": limit,
-                            "offset": offset,
-                            "hasMore": False,
-                            "page": 1,
-                            "total_pages": 1,
-                            "sortBy": sortBy,
-                            "sortOrder": sortOrder,
-                            "session": session,
-                            "note": "WAHA automator returned None - showing fallback mock data"
-                        }
+                        "data": waha_response
                     }
-
-                return {
-                    "success": True,
-                    "data": waha_response
-                }
+                note = MOCK_NOTE_NONE
             else:
-                # Fallback to mock data
-                return {
-                    "success": True,
-                    "data": {
-                        "chats": [
-                            {
-                                "id": "628123456789@c.us",
-                                "name": "John Doe",
-                                "lastMessage": "Sample message 1",
-                                "timestamp": 1704240000,
-                                "unreadCount": 2,
-                                "isGroup": False,
-                                "isOnline": True
-                            },
-                            {
-                                "id": "120363419906557011@g.us",
-                                "name": "Sample Group",
-                                "lastMessage": "Sample group message",
-                                "timestamp": 1704236400,
-                                "unreadCount": 5,
-                                "isGroup": True,
-                                "participants": 25
-                            }
-                        ],
-                        "total": 2,
-                        "limit": limit,
-                        "offset": offset,
-                        "hasMore": False,
-                        "page": 1,
-                        "total_pages": 1,
-                        "sortBy": sortBy,
-                        "sortOrder": sortOrder,
-                        "session": session,
-                        "note": "WAHA automator not available - showing mock data"
-                    }
+                note = MOCK_NOTE_UNAVAILABLE
+
+            # Fallback to mock data
+            return {
+                "success": True,
+                "data": {
+                    "chats": MOCK_CHATS,
+                    "total": len(MOCK_CHATS),
+                    "limit": limit,
+                    "offset": offset,
+                    "hasMore": False,
+                    "page": 1,
+                    "total_pages": 1,
+                    "sortBy": sortBy,
+                    "sortOrder": sortOrder,
+                    "session": session,
+                    "note": note
                 }
+            }
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
     # Webhook endpoint
     @app.post("/api/waba/webhook")
-    async def webhook_handler(request: dict):
+    async def webhook_handler(payload: WebhookEvent):
         """Handle WhatsApp webhook events"""
         try:
-            event = request.get("event", "message")
-            data = request.get("data", {})
+            event = payload.event
+            data = payload.data
 
             # Process auto-response for message events
-            if event == "message" and not data.get("fromMe", False):
-                message_body = data.get("body", "")
-                chat_id = data.get("from", "")
+            if event == "message" and data is not None and not data.fromMe:
+                message_body = data.body
+                chat_id = data.from_
 
                 if message_body and chat_id and WAHA_AUTOMATOR_AVAILABLE:
                     # Generate auto-response
                     auto_response = generate_auto_response(message_body)
 
                     # Send auto-response via WAHA
-                    waha_response = send_whatsapp_message(
+                    waha_response = await call_waha(
+                        send_whatsapp_message,
                         chat_id=chat_id,
                         message=auto_response
                     )
@@ -488,7 +564,7 @@ def create_app() -> FastAPI:
                             "auto_response_generated": True,
                             "auto_response": auto_response,
                             "waha_response": waha_response,
-                            "timestamp": settings.get_current_time()
+                            "timestamp": app.state.now_iso
                         }
                     }
                 elif message_body:
@@ -500,7 +576,7 @@ def create_app() -> FastAPI:
                             "event_processed": event,
                             "auto_response_generated": True,
                             "auto_response": auto_response,
-                            "timestamp": settings.get_current_time(),
+                            "timestamp": app.state.now_iso,
                             "note": "WAHA automator not available - response not sent"
                         }
                     }
@@ -509,7 +585,7 @@ def create_app() -> FastAPI:
                 "success": True,
                 "data": {
                     "event_processed": event,
-                    "timestamp": settings.get_current_time()
+                    "timestamp": app.state.now_iso
                 }
             }
 
@@ -524,12 +600,15 @@ app = create_app()
 if __name__ == "__main__":
     import uvicorn
 
-    # Run development server
+    # Run server on uvloop + httptools (see requirements.txt; uvloop has no Windows build).
+    # Access logging costs a log record per request, so it is only on in DEBUG
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
         reload=settings.DEBUG,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         log_level="info",
-        access_log=True
+        access_log=settings.DEBUG
     )
\ No newline at end of file